@@ -0,0 +1,175 @@
+"""HTTP client for word details: phonetics, examples and a pronunciation URL.
+
+Requests share a small pool of keep-alive connections, at most
+`max_connections` at a time, each with a timeout. Connection errors, 429
+and 5xx answers are retried with exponential backoff. Servers with a batch
+endpoint resolve many words in one request; otherwise a batch runs as
+parallel single requests over the pool.
+
+Details are dicts: {'phonetic': str, 'examples': [str], 'audio': url or None}
+"""
+import http.client
+import json
+import logging
+import os
+import queue
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote, urlsplit
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BASE_URL = 'https://api.dictionaryapi.dev/api/v2/entries/en/'
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class ConnectionPool:
+    """Keep-alive HTTP(S) connections to one host, at most max_connections in use"""
+
+    def __init__(self, host, port=None, https=True, max_connections=4, timeout=8):
+        self.host = host
+        self.port = port
+        self.connection_class = http.client.HTTPSConnection if https else http.client.HTTPConnection
+        self.timeout = timeout
+        self.slots = threading.BoundedSemaphore(max_connections)
+        self.idle = queue.LifoQueue()
+
+    def request(self, method, path, body=None, headers=None):
+        """(status, headers, body bytes) of one request"""
+        with self.slots:
+            try:
+                conn, reused = self.idle.get_nowait(), True
+            except queue.Empty:
+                conn, reused = self.connect(), False
+            try:
+                return self.send(conn, method, path, body, headers)
+            except (OSError, http.client.HTTPException):
+                conn.close()
+                if not reused:
+                    raise
+            # The server may have closed an idle keep-alive connection; one fresh try
+            conn = self.connect()
+            try:
+                return self.send(conn, method, path, body, headers)
+            except (OSError, http.client.HTTPException):
+                conn.close()
+                raise
+
+    def connect(self):
+        return self.connection_class(self.host, self.port, timeout=self.timeout)
+
+    def send(self, conn, method, path, body, headers):
+        conn.request(method, path, body=body, headers=headers or {})
+        response = conn.getresponse()
+        data = response.read()
+        if response.will_close:
+            conn.close()
+        else:
+            self.idle.put(conn)
+        return response.status, response.headers, data
+
+    def close(self):
+        while True:
+            try:
+                self.idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+class APIService:
+    def __init__(self, base_url=DEFAULT_BASE_URL, batch_url=None, max_connections=4,
+                 timeout=8, retries=3, backoff=0.5, max_batch=100):
+        url = urlsplit(base_url)
+        self.base_path = url.path if url.path.endswith('/') else url.path + '/'
+        # POST {"words": [...]} -> {word: entries or null}; None if the server has none
+        self.batch_path = urlsplit(batch_url).path if batch_url else None
+        self.pool = ConnectionPool(url.hostname, url.port, url.scheme == 'https',
+                                   max_connections, timeout)
+        self.max_connections = max_connections
+        self.retries = retries
+        self.backoff = backoff
+        self.max_batch = max_batch
+        self.headers = {'Accept': 'application/json', 'User-Agent': 'VocabularyMaster'}
+
+    @classmethod
+    def from_environment(cls, **options):
+        """Service for VOCAB_API_URL / VOCAB_API_BATCH_URL, e.g. the local dev_server"""
+        return cls(os.environ.get('VOCAB_API_URL', DEFAULT_BASE_URL),
+                   os.environ.get('VOCAB_API_BATCH_URL'), **options)
+
+    def request(self, method, path, body=None):
+        """Decoded JSON of a successful answer; None for 404 and after the last retry"""
+        headers = dict(self.headers)
+        if body is not None:
+            body = json.dumps(body).encode()
+            headers['Content-Type'] = 'application/json'
+
+        for attempt in range(self.retries + 1):
+            delay = self.backoff * 2 ** attempt * random.uniform(0.75, 1.25)
+            try:
+                status, response_headers, data = self.pool.request(method, path, body, headers)
+            except (OSError, http.client.HTTPException) as e:
+                logger.info('%s %s failed: %r', method, path, e)
+            else:
+                if status == 200:
+                    return json.loads(data)
+                if status not in RETRY_STATUSES:
+                    return None
+                retry_after = response_headers.get('Retry-After', '')
+                if retry_after.isdigit():
+                    delay = min(int(retry_after), 30)
+            if attempt < self.retries:
+                time.sleep(delay)
+        return None
+
+    def get_word_details(self, word):
+        entries = self.request('GET', self.base_path + quote(word.strip().lower()))
+        return parse_entries(entries)
+
+    def get_word_details_batch(self, words):
+        """{word: details or None} for many words in as few requests as possible"""
+        words = list(dict.fromkeys(word.strip().lower() for word in words))
+        if self.batch_path is None:
+            with ThreadPoolExecutor(max_workers=self.max_connections) as executor:
+                return dict(zip(words, executor.map(self.get_word_details, words)))
+
+        results = {}
+        for start in range(0, len(words), self.max_batch):
+            chunk = words[start:start + self.max_batch]
+            answer = self.request('POST', self.batch_path, {'words': chunk}) or {}
+            for word in chunk:
+                results[word] = parse_entries(answer.get(word))
+        return results
+
+    def play_audio(self, word):
+        from audio_cache import play_file
+        details = self.get_word_details(word)
+        if not details or not details.get('audio'):
+            return False
+        return play_file(details['audio'])
+
+    def close(self):
+        self.pool.close()
+
+
+def parse_entries(entries):
+    """Details from a dictionaryapi.dev style list of entries"""
+    if not entries or not isinstance(entries, list):
+        return None
+    phonetic = ''
+    audio = None
+    examples = []
+    for entry in entries:
+        phonetic = phonetic or entry.get('phonetic') or ''
+        for item in entry.get('phonetics', []):
+            phonetic = phonetic or item.get('text') or ''
+            audio = audio or item.get('audio') or None
+        for meaning in entry.get('meanings', []):
+            for definition in meaning.get('definitions', []):
+                if definition.get('example'):
+                    examples.append(definition['example'])
+    if audio and audio.startswith('//'):
+        audio = 'https:' + audio
+    return {'phonetic': phonetic.strip('/'), 'examples': examples[:2], 'audio': audio}
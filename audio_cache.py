@@ -0,0 +1,133 @@
+"""On-disk cache of pronunciation audio.
+
+Files are named by the hash of their content, written atomically and kept
+under a byte budget by evicting the least recently played words. The
+word -> file index lives in the cache file, on a connection shared with
+DetailCache.
+"""
+import hashlib
+import os
+import tempfile
+import threading
+import time
+from urllib.parse import urlparse
+from urllib.request import urlopen
+
+from database import CACHE_PATH, connect
+
+MAX_AUDIO_BYTES = 512 * 1024
+# used_at is only rewritten when it is older than this, as in DetailCache
+TOUCH_INTERVAL = 60 * 60
+
+
+def download_audio(url, timeout=10):
+    """(bytes, extension) of a pronunciation file, or None"""
+    with urlopen(url, timeout=timeout) as response:
+        data = response.read(MAX_AUDIO_BYTES + 1)
+    if len(data) > MAX_AUDIO_BYTES:
+        return None
+    return data, os.path.splitext(urlparse(url).path)[1] or '.mp3'
+
+
+def play_file(path):
+    from kivy.core.audio import SoundLoader
+    sound = SoundLoader.load(path)
+    if sound is None:
+        return False
+    sound.play()
+    return True
+
+
+class CacheStore:
+    """Connection to the cache file for AudioCache and DetailCache.
+
+    Both are used from worker threads; sharing one connection and its lock
+    keeps their transactions apart and leaves a single writer on the file.
+    """
+
+    def __init__(self, path=CACHE_PATH):
+        self.lock = threading.Lock()
+        self.conn = connect(path, check_same_thread=False)
+
+
+class AudioCache:
+    def __init__(self, directory, path=CACHE_PATH, max_bytes=20 * 1024 * 1024, store=None):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+        store = store or CacheStore(path)
+        self.lock = store.lock
+        self.conn = store.conn
+        with self.conn:
+            self.conn.execute('''
+                CREATE TABLE IF NOT EXISTS audio_cache (
+                    word TEXT PRIMARY KEY,
+                    file TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    used_at INTEGER NOT NULL
+                )
+            ''')
+            self.conn.execute('CREATE INDEX IF NOT EXISTS idx_audio_cache_used ON audio_cache (used_at)')
+            self.conn.execute('CREATE INDEX IF NOT EXISTS idx_audio_cache_file ON audio_cache (file)')
+
+    def get(self, word):
+        """Path of the cached pronunciation of word, or None"""
+        key = word.strip().casefold()
+        now = int(time.time())
+        with self.lock:
+            row = self.conn.execute('SELECT file, used_at FROM audio_cache WHERE word = ?',
+                                    (key,)).fetchone()
+            if row is None:
+                return None
+            name, used_at = row
+            path = os.path.join(self.directory, name)
+            if not os.path.exists(path):
+                with self.conn:
+                    self.conn.execute('DELETE FROM audio_cache WHERE word = ?', (key,))
+                return None
+            if now - used_at > TOUCH_INTERVAL:
+                with self.conn:
+                    self.conn.execute('UPDATE audio_cache SET used_at = ? WHERE word = ?', (now, key))
+        return path
+
+    def put(self, word, data, extension='.mp3'):
+        """Store the audio for word and return its path"""
+        name = hashlib.sha256(data).hexdigest()[:32] + extension
+        path = os.path.join(self.directory, name)
+        if not os.path.exists(path):
+            # Write next to the target and rename, so readers never see a partial file
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.part')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+            except OSError:
+                os.unlink(tmp_path)
+                raise
+
+        with self.lock, self.conn:
+            self.conn.execute('''
+                INSERT OR REPLACE INTO audio_cache (word, file, size, used_at)
+                VALUES (?, ?, ?, ?)
+            ''', (word.strip().casefold(), name, len(data), int(time.time())))
+            self._evict(keep=word.strip().casefold())
+        return path
+
+    def _evict(self, keep):
+        total = self.conn.execute('SELECT coalesce(sum(size), 0) FROM audio_cache').fetchone()[0]
+        while total > self.max_bytes:
+            row = self.conn.execute(
+                'SELECT word, file, size FROM audio_cache WHERE word != ? ORDER BY used_at LIMIT 1',
+                (keep,)
+            ).fetchone()
+            if row is None:
+                break
+            word, name, size = row
+            self.conn.execute('DELETE FROM audio_cache WHERE word = ?', (word,))
+            total -= size
+            # Identical audio is shared between words; keep the file while referenced
+            if self.conn.execute('SELECT 1 FROM audio_cache WHERE file = ?', (name,)).fetchone() is None:
+                try:
+                    os.remove(os.path.join(self.directory, name))
+                except OSError:
+                    pass
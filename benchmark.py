@@ -0,0 +1,242 @@
+"""Headless benchmarks for the database layer and the word list paths.
+
+    python benchmark.py                                  # 1k, 100k and 1M words
+    python benchmark.py --sizes 1000 100000 --output results.json
+    python benchmark.py --save-baseline benchmark_baseline.json
+    python benchmark.py --baseline benchmark_baseline.json
+
+Each deck is built from synthetic English/Persian words with a mix of new,
+learning and learned review states, in a temporary SQLite file; nearly every
+unlearned word starts out due, and the due queue is measured again once the
+deck is caught up (0.1% and then nothing due). Timings are in milliseconds.
+With --baseline the run exits with status 1 when an operation's median is
+slower than the baseline by more than the tolerance.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+from database import Database
+
+DEFAULT_SIZES = (1000, 100000, 1000000)
+# Same limits as WordsListScreen
+PAGE_SIZE = 50
+SEARCH_LIMIT = 100
+
+SYLLABLES = ('ba', 'ke', 'lo', 'mi', 'ran', 'sto', 'pre', 'ing', 'ter', 'ful',
+             'con', 'dis', 'ver', 'al', 'ous', 'nu', 'tion', 'ly', 'gra', 'ph')
+PERSIAN_LETTERS = 'ابپتثجچحخدذرزژسشصضطظعغفقکگلمنوهی'
+
+
+def synthetic_words(count, rng):
+    for _ in range(count):
+        english = ''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4)))
+        persian = ''.join(rng.choice(PERSIAN_LETTERS) for _ in range(rng.randint(3, 7)))
+        if rng.random() < 0.2:
+            # Some meanings are two words, e.g. verbs with "کردن"
+            persian += ' کردن'
+        yield english, persian
+
+
+def add_review_states(db, rng):
+    """Give ~70% of the words a review history: some due, some learned"""
+    today = date.today()
+    rows = []
+    for (word_id,) in db.conn.execute('SELECT id FROM words'):
+        if rng.random() < 0.3:
+            continue
+        streak = rng.choice((0, 0, 1, 1, 2, 3, 4, 5))
+        wrong = rng.randint(0, 4)
+        last_review = today - timedelta(days=rng.randint(0, 60))
+        next_review = last_review + timedelta(days=db.scheduler.interval(streak, 2.5))
+        rows.append((int(streak >= 3), streak, wrong, last_review.isoformat(),
+                     next_review.isoformat(), round(rng.uniform(1.3, 3.0), 2), word_id))
+    with db.conn:
+        db.conn.executemany('''
+            UPDATE words
+            SET learned = ?, correct_count = ?, wrong_count = ?,
+                last_review = ?, next_review = ?, ease = ?
+            WHERE id = ?
+        ''', rows)
+        db.conn.execute('''
+            INSERT INTO reviews (word_id, day, grade, response_ms)
+            SELECT id, CAST(julianday(last_review) - 2440587.5 AS INTEGER), correct_count > 0, 2500
+            FROM words WHERE last_review IS NOT NULL
+        ''')
+
+
+def catch_up(db, rng, due_fraction):
+    """Move every unlearned word a week ahead except a due_fraction of them"""
+    today = date.today()
+    ids = [row[0] for row in db.conn.execute('SELECT id FROM words WHERE learned = 0')]
+    due = set(rng.sample(ids, int(len(ids) * due_fraction)))
+    later = (today + timedelta(days=7)).isoformat()
+    with db.conn:
+        db.conn.executemany('UPDATE words SET next_review = ? WHERE id = ?',
+                            ((today.isoformat() if word_id in due else later, word_id)
+                             for word_id in ids))
+
+
+def measure(fn, runs):
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+def summarize(samples):
+    samples = sorted(samples)
+    return {
+        'median_ms': round(statistics.median(samples), 3),
+        'p95_ms': round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 3),
+        'runs': len(samples),
+    }
+
+
+def typed_prefixes(text):
+    """Queries the word list sees while text is typed one key at a time"""
+    return [text[:end] for end in range(1, len(text) + 1)]
+
+
+def bench_size(size, seed, directory):
+    rng = random.Random(seed)
+    path = os.path.join(directory, f'bench_{size}.db')
+    db = Database(path, seed=seed, initial_words=False)
+    results = {}
+
+    results['add_words_bulk'] = measure(lambda: db.add_words_bulk(synthetic_words(size, rng)), 1)
+    add_review_states(db, rng)
+    db.conn.execute('ANALYZE')
+
+    results['get_daily_words'] = measure(lambda: db.get_daily_words(10), 50)
+    # A long practice session refilling its queue past the words it already has
+    taken = [word.id for word in db.get_daily_words(300)]
+    results['get_daily_words_refill'] = measure(lambda: db.get_daily_words(10, exclude=taken), 50)
+
+    due = [word.id for word in db.get_daily_words(200)]
+    answers = iter(due)
+    results['update_word_status'] = measure(
+        lambda: db.update_word_status(next(answers), rng.random() < 0.7, 2000), min(100, len(due)))
+
+    db.start_writer()
+    answers = iter(due)
+
+    def answer_batch():
+        for _ in range(20):
+            db.update_word_status(next(answers, due[0]), rng.random() < 0.7, 2000)
+        db.flush()
+
+    results['update_word_status_writer_x20'] = measure(answer_batch, 5)
+    db.writer.close()
+    db.writer = None
+
+    results['get_statistics'] = measure(db.get_statistics, 200)
+
+    # The usual state of a user who keeps up: few or no words due
+    catch_up(db, rng, 0.001)
+    results['get_daily_words_few_due'] = measure(lambda: db.get_daily_words(10), 50)
+    catch_up(db, rng, 0)
+    results['get_daily_words_none_due'] = measure(lambda: db.get_daily_words(10), 50)
+
+    results['get_all_words'] = measure(db.get_all_words, 3 if size < 1000000 else 1)
+
+    def first_pages():
+        pages = db.iter_words(limit=PAGE_SIZE)
+        for _ in range(PAGE_SIZE * 10):
+            next(pages, None)
+
+    results['word_list_10_pages'] = measure(first_pages, 10)
+
+    samples = {'english': [], 'persian': []}
+    count = db.conn.execute('SELECT max(id) FROM words').fetchone()[0]
+    for word_id in rng.sample(range(1, count + 1), min(30, count)):
+        english, persian = db.conn.execute(
+            'SELECT english, persian FROM words WHERE id = ?', (word_id,)).fetchone()
+        for query in typed_prefixes(english):
+            samples['english'] += measure(lambda: db.search_words(query, SEARCH_LIMIT), 1)
+        for query in typed_prefixes(persian):
+            samples['persian'] += measure(lambda: db.search_words(query, SEARCH_LIMIT), 1)
+    results['search_words_english'] = samples['english']
+    results['search_words_persian'] = samples['persian']
+
+    db.close()
+    return {name: summarize(values) for name, values in results.items() if values}
+
+
+def compare(results, baseline, tolerance, min_delta_ms):
+    """Regressions as (size, operation, baseline_ms, current_ms)"""
+    regressions = []
+    for size, operations in results.items():
+        for name, current in operations.items():
+            previous = baseline.get(size, {}).get(name)
+            if previous is None:
+                continue
+            before, after = previous['median_ms'], current['median_ms']
+            if after > before * (1 + tolerance) and after - before > min_delta_ms:
+                regressions.append((size, name, before, after))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES)
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--output', help='write the results to this JSON file')
+    parser.add_argument('--baseline', help='fail when slower than this results file')
+    parser.add_argument('--save-baseline', help='write the results as the new baseline')
+    parser.add_argument('--tolerance', type=float, default=0.5,
+                        help='allowed slowdown against the baseline (0.5 = 50%%)')
+    parser.add_argument('--min-delta-ms', type=float, default=0.5,
+                        help='ignore slowdowns smaller than this many milliseconds')
+    args = parser.parse_args(argv)
+
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for size in args.sizes:
+            print(f'{size} words...', file=sys.stderr)
+            results[str(size)] = bench_size(size, args.seed, directory)
+            for name, summary in results[str(size)].items():
+                print(f'  {name:<32} {summary["median_ms"]:>10.3f} ms  p95 {summary["p95_ms"]:.3f}',
+                      file=sys.stderr)
+
+    report = {
+        'meta': {
+            'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'sqlite': sqlite3.sqlite_version,
+            'machine': platform.machine(),
+            'seed': args.seed,
+        },
+        'results': results,
+    }
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2)
+    if not args.output:
+        print(json.dumps(report, indent=2))
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)['results']
+        regressions = compare(results, baseline, args.tolerance, args.min_delta_ms)
+        for size, name, before, after in regressions:
+            print(f'REGRESSION {size} words {name}: {before:.3f} ms -> {after:.3f} ms',
+                  file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
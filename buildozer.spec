@@ -3,7 +3,7 @@ title = Vocab Learning
 package.name = vocabapp
 package.domain = org.vocabapp
 source.dir = .
-source.include_exts = py,png,jpg,kv,atlas,db
+source.include_exts = py,png,jpg,kv,atlas,db,vdp
 version = 1.0
 requirements = python3,kivy==2.1.0
 orientation = portrait
@@ -1,13 +1,133 @@
+import os
 import sqlite3
-from datetime import datetime, timedelta
+import random
+import unicodedata
+from datetime import date, datetime, timedelta
 import json
+import logging
+
+from scheduler import SM2Scheduler
+
+logger = logging.getLogger(__name__)
+
+DB_PATH = 'vocabulary.db'
+# Longest a flush() waits for queued answers to be committed
+FLUSH_TIMEOUT = 10
+
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def cache_path_for(path):
+    """The file next to a word database that holds its download caches"""
+    root, extension = os.path.splitext(path)
+    return root + '_cache' + extension
+
+
+# Word details and the audio index: rebuildable, so kept out of the word
+# database and away from the answer writer
+CACHE_PATH = cache_path_for(DB_PATH)
+
+
+# Arabic code points that Persian keyboards and word lists mix in
+_PERSIAN_CHARS = {
+    0x064a: '\u06cc',  # Arabic yeh -> Persian yeh
+    0x0649: '\u06cc',  # alef maksura -> Persian yeh
+    0x0643: '\u06a9',  # Arabic kaf -> Persian kaf
+    0x06d5: '\u0647',  # heh left over from decomposing heh with yeh
+    0x200c: None,       # ZWNJ
+    0x200d: None,       # ZWJ
+    0x0640: None,       # tatweel
+}
+
+# Latin and Arabic-script combining marks (accents, harakat) are dropped
+_DIACRITIC_RANGES = [(0x0300, 0x0700), (0x1ab0, 0x1b00), (0x1dc0, 0x1e00),
+                     (0x20d0, 0x2100), (0x08d3, 0x0900), (0xfe20, 0xfe30)]
+_SEARCH_CHARS = dict(_PERSIAN_CHARS)
+for start, end in _DIACRITIC_RANGES:
+    _SEARCH_CHARS.update((c, None) for c in range(start, end) if unicodedata.combining(chr(c)))
+
+
+def normalize_text(text):
+    """Search form of a word: case-folded, no diacritics, unified Persian letters"""
+    if not text:
+        return ''
+    if text.isascii():
+        return text.casefold()
+    return unicodedata.normalize('NFKD', text).translate(_SEARCH_CHARS).casefold()
+
+
+def fts_query(text):
+    """Turn user input into an FTS5 query matching every word as a prefix"""
+    terms = normalize_text(text).split()
+    return ' '.join('"%s"*' % term.replace('"', '""') for term in terms)
+
+
+def connect(path=DB_PATH, check_same_thread=True):
+    """Open a connection tuned for the app: WAL journal, relaxed fsync, bigger caches"""
+    conn = sqlite3.connect(path, cached_statements=256, check_same_thread=check_same_thread)
+    # Used by the words_fts triggers, so every connection that writes needs it
+    conn.create_function('normalize_text', 1, normalize_text, deterministic=True)
+    conn.create_function('search_trigger_enabled', 0, lambda: 1)
+    conn.create_function('stats_trigger_enabled', 0, lambda: 1)
+    conn.execute('PRAGMA journal_mode = WAL')
+    conn.execute('PRAGMA synchronous = NORMAL')
+    conn.execute('PRAGMA cache_size = -8000')
+    conn.execute('PRAGMA mmap_size = 67108864')
+    conn.execute('PRAGMA temp_store = MEMORY')
+    return conn
+
+
+WORD_COLUMNS = ('id', 'english', 'persian', 'learned', 'correct_count', 'wrong_count',
+                'last_review', 'next_review', 'created_at', 'ease')
+WORD_FIELDS = ', '.join('words.' + column for column in WORD_COLUMNS)
+
+
+class Word:
+    """One row of the words table; slots keep 100k-word lists small"""
+    __slots__ = WORD_COLUMNS
+    
+    def __init__(self, id, english, persian, learned, correct_count, wrong_count,
+                 last_review, next_review, created_at, ease):
+        self.id = id
+        self.english = english
+        self.persian = persian
+        self.learned = learned
+        self.correct_count = correct_count
+        self.wrong_count = wrong_count
+        self.last_review = last_review
+        self.next_review = next_review
+        self.created_at = created_at
+        self.ease = ease
+    
+    def __repr__(self):
+        return f'Word({self.id}, {self.english!r}, {self.persian!r})'
+
+
+_shared_db = None
+
+
+def get_database():
+    """The process-wide Database; screens share it instead of opening their own"""
+    global _shared_db
+    if _shared_db is None:
+        _shared_db = Database()
+        _shared_db.start_writer()
+    return _shared_db
+
 
 class Database:
-    def __init__(self):
-        self.conn = sqlite3.connect('vocabulary.db')
+    def __init__(self, path=DB_PATH, seed=None, scheduler=None, initial_words=True):
+        self.path = path
+        self.scheduler = scheduler or SM2Scheduler()
+        self.conn = connect(path)
         self.cursor = self.conn.cursor()
+        # Seedable source for the shuffle keys that break ties in the due queue
+        self.rng = random.Random(seed)
+        self.writer = None
         self.create_tables()
-        self.load_initial_words()
+        # The demo words are for the app; tools that fill a deck pass initial_words=False
+        if initial_words:
+            self.load_initial_words()
     
     def create_tables(self):
         self.cursor.execute('''
@@ -20,70 +140,633 @@ class Database:
                 wrong_count INTEGER DEFAULT 0,
                 last_review DATE,
                 next_review DATE,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                shuffle_key INTEGER DEFAULT 0,
+                ease REAL DEFAULT 2.5
             )
         ''')
+        
+        columns = [row[1] for row in self.cursor.execute('PRAGMA table_info(words)')]
+        if 'shuffle_key' not in columns:
+            # Older databases: add the column and give existing words a random position
+            self.cursor.execute('ALTER TABLE words ADD COLUMN shuffle_key INTEGER DEFAULT 0')
+            self.cursor.execute('UPDATE words SET shuffle_key = abs(random() % 2147483648)')
+        if 'ease' not in columns:
+            self.cursor.execute('ALTER TABLE words ADD COLUMN ease REAL DEFAULT 2.5')
+        
+        # Due queue: unlearned words in practice order, next_review kept in the
+        # index so the due filter never has to touch the table rows
+        self.cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_words_due
+            ON words (wrong_count DESC, shuffle_key, next_review)
+            WHERE learned = 0
+        ''')
+        # The same words by due date ('' for never scheduled, as in due_counts),
+        # so a few due words are one range read however large the deck is
+        self.cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_words_due_date
+            ON words (coalesce(next_review, ''), wrong_count DESC, shuffle_key)
+            WHERE learned = 0
+        ''')
+        
+        # Word list pages walk the rowid instead: ids follow insertion order, and
+        # SQLite could only seek on created_at in a (created_at, id) comparison
+        self.cursor.execute('DROP INDEX IF EXISTS idx_words_created')
+        # Older files kept the download caches here; they now live in CACHE_PATH
+        self.cursor.execute('DROP TABLE IF EXISTS detail_cache')
+        self.cursor.execute('DROP TABLE IF EXISTS audio_cache')
+        
+        self.fts = self.create_search_index()
+        self.create_statistics_tables()
+        self.create_review_log()
         self.conn.commit()
     
+    def create_review_log(self):
+        """Append-only answer history: one small row per answer, never updated.
+        
+        day is days since 1970-01-01, grade is 1 (known) or 0 (missed).
+        Old events can be folded into review_summary by compact_reviews.
+        """
+        self.cursor.execute('''
+            CREATE TABLE IF NOT EXISTS reviews (
+                word_id INTEGER NOT NULL,
+                day INTEGER NOT NULL,
+                grade INTEGER NOT NULL,
+                response_ms INTEGER
+            )
+        ''')
+        self.cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_reviews_word
+            ON reviews (word_id, day)
+        ''')
+        self.cursor.execute('''
+            CREATE TABLE IF NOT EXISTS review_summary (
+                word_id INTEGER PRIMARY KEY,
+                reviews INTEGER NOT NULL,
+                correct INTEGER NOT NULL,
+                first_day INTEGER NOT NULL,
+                last_day INTEGER NOT NULL
+            )
+        ''')
+    
+    def create_statistics_tables(self):
+        """Summary counters kept current by triggers, so get_statistics never scans words.
+        
+        due_counts holds the number of unlearned words per next_review day
+        ('' for never scheduled); due today is the sum over days up to today.
+        """
+        self.cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'word_stats'")
+        exists = self.cursor.fetchone() is not None
+        
+        # Recreate the update trigger of older files, which had no switch for bulk updates
+        self.cursor.execute("SELECT sql FROM sqlite_master WHERE name = 'word_stats_update'")
+        row = self.cursor.fetchone()
+        if row is not None and 'stats_trigger_enabled' not in row[0]:
+            self.cursor.execute('DROP TRIGGER word_stats_update')
+        
+        self.cursor.executescript('''
+            CREATE TABLE IF NOT EXISTS word_stats (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                learned INTEGER NOT NULL DEFAULT 0,
+                learning INTEGER NOT NULL DEFAULT 0,
+                correct_total INTEGER NOT NULL DEFAULT 0,
+                wrong_total INTEGER NOT NULL DEFAULT 0
+            );
+            
+            CREATE TABLE IF NOT EXISTS due_counts (
+                day TEXT PRIMARY KEY,
+                words INTEGER NOT NULL DEFAULT 0
+            ) WITHOUT ROWID;
+            
+            CREATE TRIGGER IF NOT EXISTS word_stats_insert AFTER INSERT ON words BEGIN
+                UPDATE word_stats
+                SET learned = learned + (new.learned = 1),
+                    learning = learning + (new.learned = 0),
+                    correct_total = correct_total + new.correct_count,
+                    wrong_total = wrong_total + new.wrong_count
+                WHERE id = 1;
+                INSERT INTO due_counts (day, words)
+                SELECT coalesce(new.next_review, ''), 1 WHERE new.learned = 0
+                ON CONFLICT (day) DO UPDATE SET words = words + 1;
+            END;
+            
+            CREATE TRIGGER IF NOT EXISTS word_stats_delete AFTER DELETE ON words BEGIN
+                UPDATE word_stats
+                SET learned = learned - (old.learned = 1),
+                    learning = learning - (old.learned = 0),
+                    correct_total = correct_total - old.correct_count,
+                    wrong_total = wrong_total - old.wrong_count
+                WHERE id = 1;
+                UPDATE due_counts SET words = words - 1
+                WHERE day = coalesce(old.next_review, '') AND old.learned = 0;
+                DELETE FROM due_counts WHERE day = coalesce(old.next_review, '') AND words <= 0;
+            END;
+            
+            CREATE TRIGGER IF NOT EXISTS word_stats_update
+            AFTER UPDATE OF learned, next_review, correct_count, wrong_count ON words
+            WHEN stats_trigger_enabled() BEGIN
+                UPDATE word_stats
+                SET learned = learned + (new.learned = 1) - (old.learned = 1),
+                    learning = learning + (new.learned = 0) - (old.learned = 0),
+                    -- correct_count is a streak that resets on a miss; only growth is a new answer
+                    correct_total = correct_total + max(new.correct_count - old.correct_count, 0),
+                    wrong_total = wrong_total + new.wrong_count - old.wrong_count
+                WHERE id = 1;
+                UPDATE due_counts SET words = words - 1
+                WHERE day = coalesce(old.next_review, '') AND old.learned = 0;
+                DELETE FROM due_counts WHERE day = coalesce(old.next_review, '') AND words <= 0;
+                INSERT INTO due_counts (day, words)
+                SELECT coalesce(new.next_review, ''), 1 WHERE new.learned = 0
+                ON CONFLICT (day) DO UPDATE SET words = words + 1;
+            END;
+        ''')
+        
+        if not exists:
+            self.cursor.execute('''
+                INSERT INTO word_stats (id, learned, learning, correct_total, wrong_total)
+                SELECT 1,
+                       coalesce(sum(learned = 1), 0),
+                       coalesce(sum(learned = 0), 0),
+                       coalesce(sum(correct_count), 0),
+                       coalesce(sum(wrong_count), 0)
+                FROM words
+            ''')
+            self.cursor.execute('''
+                INSERT INTO due_counts (day, words)
+                SELECT coalesce(next_review, ''), count(*) FROM words
+                WHERE learned = 0
+                GROUP BY 1
+            ''')
+    
+    def recount_schedule_stats(self):
+        """Rebuild learned/learning and due_counts from the words table in one pass each"""
+        self.cursor.execute('''
+            UPDATE word_stats
+            SET (learned, learning) = (
+                SELECT coalesce(sum(learned = 1), 0), coalesce(sum(learned = 0), 0) FROM words
+            )
+            WHERE id = 1
+        ''')
+        self.cursor.execute('DELETE FROM due_counts')
+        self.cursor.execute('''
+            INSERT INTO due_counts (day, words)
+            SELECT coalesce(next_review, ''), count(*) FROM words
+            WHERE learned = 0
+            GROUP BY 1
+        ''')
+    
+    def create_search_index(self):
+        """Full-text index over normalized english/persian, kept in sync by triggers.
+        
+        Returns False when this SQLite build has no FTS5; search then falls
+        back to LIKE.
+        """
+        self.cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'words_fts'")
+        exists = self.cursor.fetchone() is not None
+        try:
+            self.cursor.execute('''
+                CREATE VIRTUAL TABLE IF NOT EXISTS words_fts USING fts5(
+                    english, persian,
+                    content='',
+                    tokenize='unicode61 remove_diacritics 2',
+                    prefix='2 3'
+                )
+            ''')
+        except sqlite3.OperationalError:
+            return False
+        
+        self.cursor.executescript('''
+            CREATE TRIGGER IF NOT EXISTS words_fts_insert AFTER INSERT ON words
+            WHEN search_trigger_enabled() BEGIN
+                INSERT INTO words_fts (rowid, english, persian)
+                VALUES (new.id, normalize_text(new.english), normalize_text(new.persian));
+            END;
+            
+            CREATE TRIGGER IF NOT EXISTS words_fts_delete AFTER DELETE ON words BEGIN
+                INSERT INTO words_fts (words_fts, rowid, english, persian)
+                VALUES ('delete', old.id, normalize_text(old.english), normalize_text(old.persian));
+            END;
+            
+            CREATE TRIGGER IF NOT EXISTS words_fts_update AFTER UPDATE OF english, persian ON words BEGIN
+                INSERT INTO words_fts (words_fts, rowid, english, persian)
+                VALUES ('delete', old.id, normalize_text(old.english), normalize_text(old.persian));
+                INSERT INTO words_fts (rowid, english, persian)
+                VALUES (new.id, normalize_text(new.english), normalize_text(new.persian));
+            END;
+        ''')
+        
+        if not exists:
+            # Index words that were added before the search index existed
+            self.cursor.execute('''
+                INSERT INTO words_fts (rowid, english, persian)
+                SELECT id, normalize_text(english), normalize_text(persian) FROM words
+            ''')
+        return True
+    
+    def new_shuffle_key(self):
+        return self.rng.getrandbits(31)
+    
     def add_word(self, english, persian):
         today = datetime.now().strftime('%Y-%m-%d')
         self.cursor.execute('''
-            INSERT INTO words (english, persian, next_review)
-            VALUES (?, ?, ?)
-        ''', (english, persian, today))
+            INSERT INTO words (english, persian, next_review, shuffle_key)
+            VALUES (?, ?, ?, ?)
+        ''', (english, persian, today, self.new_shuffle_key()))
         self.conn.commit()
     
-    def get_daily_words(self, limit=10):
+    def add_words_bulk(self, pairs, chunk_size=5000, progress=None):
+        """Insert (english, persian) pairs from any iterable, one transaction per chunk.
+        
+        progress, if given, is called with the running total after each chunk.
+        """
+        today = datetime.now().strftime('%Y-%m-%d')
+        total = 0
+        chunk = []
+        for english, persian in pairs:
+            chunk.append((english, persian, today, self.new_shuffle_key()))
+            if len(chunk) >= chunk_size:
+                total += self._insert_chunk(chunk)
+                chunk = []
+                if progress:
+                    progress(total)
+        if chunk:
+            total += self._insert_chunk(chunk)
+            if progress:
+                progress(total)
+        return total
+    
+    def _insert_chunk(self, rows):
+        if not self.fts:
+            with self.conn:
+                self.cursor.executemany('''
+                    INSERT INTO words (english, persian, next_review, shuffle_key)
+                    VALUES (?, ?, ?, ?)
+                ''', rows)
+            return len(rows)
+        
+        # FTS5 flushes its pending index data at every trigger invocation,
+        # which made bulk inserts ~6x slower; index the chunk in one statement
+        self.cursor.execute('SELECT coalesce(max(id), 0) FROM words')
+        last_id = self.cursor.fetchone()[0]
+        self.conn.create_function('search_trigger_enabled', 0, lambda: 0)
+        try:
+            with self.conn:
+                self.cursor.executemany('''
+                    INSERT INTO words (english, persian, next_review, shuffle_key)
+                    VALUES (?, ?, ?, ?)
+                ''', rows)
+                self.cursor.execute('''
+                    INSERT INTO words_fts (rowid, english, persian)
+                    SELECT id, normalize_text(english), normalize_text(persian)
+                    FROM words WHERE id > ?
+                ''', (last_id,))
+        finally:
+            self.conn.create_function('search_trigger_enabled', 0, lambda: 1)
+        return len(rows)
+    
+    def get_daily_words(self, limit=10, exclude=()):
+        # exclude: ids already taken, e.g. earlier batches of the same session
         today = datetime.now().strftime('%Y-%m-%d')
         self.cursor.execute('''
-            SELECT * FROM words 
-            WHERE learned = 0 AND (next_review IS NULL OR next_review <= ?)
-            ORDER BY wrong_count DESC, RANDOM()
+            SELECT learning, (SELECT coalesce(sum(words), 0) FROM due_counts WHERE day <= ?)
+            FROM word_stats WHERE id = 1
+        ''', (today,))
+        learning, due = self.cursor.fetchone()
+        if due == 0:
+            # The usual state of a caught-up deck; due_counts answers it without an index read
+            return []
+        
+        exclude = tuple(exclude)
+        # Walking idx_words_due in practice order reads about
+        # wanted * learning / due entries before it has `limit` due words;
+        # reading the due range of idx_words_due_date and sorting it reads `due`.
+        # Take the cheaper one: the walk after an import, the range once caught up
+        wanted = limit + len(exclude)
+        index = 'idx_words_due' if due * due >= wanted * learning else 'idx_words_due_date'
+        skip = f"AND id NOT IN ({','.join('?' * len(exclude))})" if exclude else ''
+        self.cursor.execute(f'''
+            SELECT {WORD_FIELDS} FROM words INDEXED BY {index}
+            WHERE learned = 0 AND coalesce(next_review, '') <= ? {skip}
+            ORDER BY wrong_count DESC, shuffle_key
             LIMIT ?
-        ''', (today, limit))
+        ''', (today, *exclude, limit))
         
-        columns = [description[0] for description in self.cursor.description]
-        return [dict(zip(columns, row)) for row in self.cursor.fetchall()]
+        return [Word(*row) for row in self.cursor.fetchall()]
     
-    def update_word_status(self, word_id, is_correct):
+    def start_writer(self, flush_interval=2.0):
+        """Hand answer writes to a background thread with its own connection"""
+        if self.writer is None:
+            # Imported here: command-line tools never start a writer
+            from review_writer import ReviewWriter
+            self.writer = ReviewWriter(lambda: connect(self.path), self.apply_review, flush_interval)
+    
+    def update_word_status(self, word_id, is_correct, response_ms=None):
         today = datetime.now().strftime('%Y-%m-%d')
         
-        if is_correct:
-            # If correct answer, won't come tomorrow
-            self.cursor.execute('''
-                UPDATE words 
-                SET correct_count = correct_count + 1,
-                    last_review = ?,
-                    next_review = date(?, '+3 day'),
-                    learned = CASE WHEN correct_count >= 2 THEN 1 ELSE 0 END
-                WHERE id = ?
-            ''', (today, today, word_id))
-        else:
-            # If wrong answer, will come again tomorrow
-            self.cursor.execute('''
-                UPDATE words 
-                SET wrong_count = wrong_count + 1,
-                    last_review = ?,
-                    next_review = date(?, '+1 day'),
-                    correct_count = 0
-                WHERE id = ?
-            ''', (today, today, word_id))
+        if self.writer is not None:
+            self.writer.submit(word_id, is_correct, today, response_ms)
+            return
         
+        self.apply_review(self.cursor, word_id, is_correct, today, response_ms)
         self.conn.commit()
     
+    def apply_review(self, cursor, word_id, is_correct, today, response_ms=None):
+        cursor.execute('SELECT correct_count, ease FROM words WHERE id = ?', (word_id,))
+        row = cursor.fetchone()
+        if row is None:
+            return
+        
+        streak, ease, interval, learned = self.scheduler.review(row[0], row[1], is_correct)
+        cursor.execute('''
+            UPDATE words 
+            SET correct_count = ?,
+                wrong_count = wrong_count + ?,
+                ease = ?,
+                last_review = ?,
+                next_review = date(?, ?),
+                learned = ?,
+                shuffle_key = ?
+            WHERE id = ?
+        ''', (streak, 0 if is_correct else 1, ease, today, today, f'+{interval} day',
+              int(learned), self.new_shuffle_key(), word_id))
+        cursor.execute('''
+            INSERT INTO reviews (word_id, day, grade, response_ms)
+            VALUES (?, ?, ?, ?)
+        ''', (word_id, date.fromisoformat(today).toordinal() - EPOCH_ORDINAL,
+              int(is_correct), response_ms))
+    
+    def reschedule(self, scheduler=None):
+        """Recompute next_review and learned for every reviewed word, e.g. after
+        the scheduler parameters changed: one batch computation, one bulk UPDATE."""
+        if scheduler is not None:
+            self.scheduler = scheduler
+        
+        self.cursor.execute('''
+            SELECT id, correct_count, ease, last_review FROM words
+            WHERE last_review IS NOT NULL
+        ''')
+        rows = self.cursor.fetchall()
+        if not rows:
+            return 0
+        
+        ids, streaks, eases, last_reviews = zip(*rows)
+        next_reviews, learned = self.scheduler.reschedule_batch(streaks, eases, last_reviews)
+        
+        self.cursor.execute('''
+            CREATE TEMP TABLE IF NOT EXISTS reschedule_rows (
+                id INTEGER PRIMARY KEY,
+                next_review TEXT,
+                learned INTEGER NOT NULL
+            )
+        ''')
+        # The per-row statistics trigger would do three writes per word;
+        # the counters are rebuilt once after the update instead
+        self.conn.create_function('stats_trigger_enabled', 0, lambda: 0)
+        try:
+            with self.conn:
+                self.cursor.executemany('INSERT INTO reschedule_rows VALUES (?, ?, ?)',
+                                        zip(ids, next_reviews, map(int, learned)))
+                self.cursor.execute('''
+                    UPDATE words
+                    SET next_review = r.next_review, learned = r.learned
+                    FROM reschedule_rows AS r
+                    WHERE words.id = r.id
+                      AND (words.next_review IS NOT r.next_review OR words.learned != r.learned)
+                ''')
+                self.cursor.execute('DELETE FROM reschedule_rows')
+                self.recount_schedule_stats()
+        finally:
+            self.conn.create_function('stats_trigger_enabled', 0, lambda: 1)
+        return len(rows)
+    
+    def get_review_history(self, word_id, limit=50):
+        """Latest answers for one word as (day, grade, response_ms), newest first"""
+        self.cursor.execute('''
+            SELECT day, grade, response_ms FROM reviews
+            WHERE word_id = ?
+            ORDER BY day DESC
+            LIMIT ?
+        ''', (word_id, limit))
+        return self.cursor.fetchall()
+    
+    def _old_review_day(self, keep_days):
+        return date.today().toordinal() - EPOCH_ORDINAL - keep_days
+    
+    def prune_reviews(self, keep_days=365, chunk_size=10000):
+        """Drop answers older than keep_days, a chunk per transaction"""
+        before = self._old_review_day(keep_days)
+        removed = 0
+        while True:
+            # Events are appended in time order, so the old ones sit at the
+            # start of the rowid range and each chunk is found quickly
+            with self.conn:
+                self.cursor.execute('''
+                    DELETE FROM reviews WHERE rowid IN (
+                        SELECT rowid FROM reviews WHERE day < ? ORDER BY rowid LIMIT ?
+                    )
+                ''', (before, chunk_size))
+            removed += self.cursor.rowcount
+            if self.cursor.rowcount < chunk_size:
+                return removed
+    
+    def compact_reviews(self, keep_days=90, chunk_size=10000, conn=None):
+        """Fold answers older than keep_days into review_summary, a chunk per transaction.
+        
+        conn: the connection to write with, e.g. the writer thread's; default this one.
+        """
+        conn = conn or self.conn
+        cursor = conn.cursor()
+        before = self._old_review_day(keep_days)
+        compacted = 0
+        while True:
+            cursor.execute('''
+                SELECT max(rowid), count(*) FROM (
+                    SELECT rowid FROM reviews WHERE day < ? ORDER BY rowid LIMIT ?
+                )
+            ''', (before, chunk_size))
+            last_rowid, count = cursor.fetchone()
+            if not count:
+                return compacted
+            
+            with conn:
+                cursor.execute('''
+                    INSERT INTO review_summary (word_id, reviews, correct, first_day, last_day)
+                    SELECT word_id, count(*), sum(grade), min(day), max(day)
+                    FROM reviews WHERE rowid <= ? AND day < ?
+                    GROUP BY word_id
+                    ON CONFLICT (word_id) DO UPDATE SET
+                        reviews = reviews + excluded.reviews,
+                        correct = correct + excluded.correct,
+                        first_day = min(first_day, excluded.first_day),
+                        last_day = max(last_day, excluded.last_day)
+                ''', (last_rowid, before))
+                cursor.execute('DELETE FROM reviews WHERE rowid <= ? AND day < ?',
+                               (last_rowid, before))
+            compacted += count
+    
+    def compact_in_background(self, keep_days=90):
+        """compact_reviews on the writer thread, so the UI never waits on it"""
+        if self.writer is None:
+            return self.compact_reviews(keep_days)
+        self.writer.run_task(lambda conn: self.compact_reviews(keep_days, conn=conn))
+    
+    def flush(self, wait=True, timeout=FLUSH_TIMEOUT, on_done=None):
+        """Durability barrier for answers queued on the writer thread.
+
+        Returns False if they were not committed within timeout; the writer
+        keeps retrying them. on_done() is called once they are committed,
+        from the writer thread, so the UI can use wait=False.
+        """
+        if self.writer is None:
+            if on_done is not None:
+                on_done()
+            return True
+        done = self.writer.flush(wait, timeout, on_done)
+        if wait and not done:
+            logger.warning('Answers not yet saved after %s s', timeout)
+        return done
+    
     def get_statistics(self):
-        self.cursor.execute('SELECT COUNT(*) FROM words WHERE learned = 1')
-        learned = self.cursor.fetchone()[0]
+        today = datetime.now().strftime('%Y-%m-%d')
+        
+        self.cursor.execute('''
+            SELECT learned, learning, correct_total, wrong_total
+            FROM word_stats WHERE id = 1
+        ''')
+        learned, learning, correct, wrong = self.cursor.fetchone()
         
-        self.cursor.execute('SELECT COUNT(*) FROM words WHERE learned = 0')
-        learning = self.cursor.fetchone()[0]
+        self.cursor.execute('SELECT coalesce(sum(words), 0) FROM due_counts WHERE day <= ?', (today,))
+        due_today = self.cursor.fetchone()[0]
         
-        return {'learned': learned, 'learning': learning}
+        answers = correct + wrong
+        accuracy = round(correct / answers * 100) if answers > 0 else 0
+        
+        return {
+            'learned': learned,
+            'learning': learning,
+            'due_today': due_today,
+            'correct_total': correct,
+            'wrong_total': wrong,
+            'accuracy': accuracy
+        }
     
     def get_all_words(self):
-        self.cursor.execute('SELECT * FROM words ORDER BY created_at DESC')
-        columns = [description[0] for description in self.cursor.description]
-        return [dict(zip(columns, row)) for row in self.cursor.fetchall()]
+        self.cursor.execute(f'SELECT {WORD_FIELDS} FROM words ORDER BY id DESC')
+        return [Word(*row) for row in self.cursor.fetchall()]
+    
+    def search_words(self, text, limit=100):
+        """Words whose english or persian starts with each term of text, best match first"""
+        query = fts_query(text)
+        if not query:
+            return []
+        
+        if self.fts and min(len(term) for term in normalize_text(text).split()) >= 3:
+            self.cursor.execute(f'''
+                SELECT {WORD_FIELDS} FROM words_fts
+                JOIN words ON words.id = words_fts.rowid
+                WHERE words_fts MATCH ?
+                ORDER BY words_fts.rank
+                LIMIT ?
+            ''', (query, limit))
+        elif self.fts:
+            # Very short prefixes match most of the deck; ranking all of those
+            # costs far more than it is worth, so take the newest matches
+            self.cursor.execute(f'''
+                SELECT {WORD_FIELDS} FROM words_fts
+                JOIN words ON words.id = words_fts.rowid
+                WHERE words_fts MATCH ?
+                ORDER BY words_fts.rowid DESC
+                LIMIT ?
+            ''', (query, limit))
+        else:
+            pattern = f'%{text.strip()}%'
+            self.cursor.execute(f'''
+                SELECT {WORD_FIELDS} FROM words
+                WHERE english LIKE ? OR persian LIKE ?
+                ORDER BY id DESC
+                LIMIT ?
+            ''', (pattern, pattern, limit))
+        
+        return [Word(*row) for row in self.cursor.fetchall()]
+    
+    def iter_words(self, after=None, limit=50):
+        """Yield words newest first, querying `limit` rows at a time.
+        
+        after is the id of the last word already seen; ids grow with
+        insertion, so paging continues from there on the rowid instead of OFFSET.
+        """
+        while True:
+            if after is None:
+                cursor = self.conn.execute(f'''
+                    SELECT {WORD_FIELDS} FROM words
+                    ORDER BY id DESC
+                    LIMIT ?
+                ''', (limit,))
+            else:
+                cursor = self.conn.execute(f'''
+                    SELECT {WORD_FIELDS} FROM words
+                    WHERE id < ?
+                    ORDER BY id DESC
+                    LIMIT ?
+                ''', (after, limit))
+            page = [Word(*row) for row in cursor.fetchall()]
+            yield from page
+            if len(page) < limit:
+                return
+            after = page[-1].id
+    
+    def iter_pairs(self):
+        """(english, persian) of every word in insertion order, streamed from the cursor"""
+        yield from self.conn.execute('SELECT english, persian FROM words ORDER BY id')
+    
+    def analyze(self, vacuum=False):
+        """Refresh planner statistics and merge the search index; VACUUM rewrites the file"""
+        self.flush()
+        self.cursor.execute('ANALYZE')
+        if self.fts:
+            with self.conn:
+                self.cursor.execute("INSERT INTO words_fts (words_fts) VALUES ('optimize')")
+        if vacuum:
+            self.cursor.execute('VACUUM')
+    
+    def check_integrity(self):
+        """Problems found in the file, the search index and the statistics; [] if none"""
+        self.flush()
+        problems = [row[0] for row in self.cursor.execute('PRAGMA integrity_check')
+                    if row[0] != 'ok']
+        if self.fts:
+            try:
+                with self.conn:
+                    self.cursor.execute("INSERT INTO words_fts (words_fts) VALUES ('integrity-check')")
+            except sqlite3.DatabaseError as e:
+                problems.append(f'search index: {e}')
+        
+        # The counters kept by triggers must match a recount; correct_total
+        # counts answers rather than current streaks, so it cannot be recounted
+        self.cursor.execute('''
+            SELECT coalesce(sum(learned = 1), 0), coalesce(sum(learned = 0), 0),
+                   coalesce(sum(wrong_count), 0)
+            FROM words
+        ''')
+        counted = self.cursor.fetchone()
+        self.cursor.execute('SELECT learned, learning, wrong_total FROM word_stats WHERE id = 1')
+        stored = self.cursor.fetchone()
+        if stored != counted:
+            problems.append(f'word_stats (learned, learning, wrong_total) is {stored}, '
+                            f'the words table has {counted}')
+        
+        self.cursor.execute('''
+            WITH counted AS (
+                SELECT coalesce(next_review, '') AS day, count(*) AS words FROM words
+                WHERE learned = 0
+                GROUP BY 1
+            )
+            SELECT (SELECT count(*) FROM (SELECT * FROM counted EXCEPT SELECT * FROM due_counts))
+                 + (SELECT count(*) FROM (SELECT * FROM due_counts EXCEPT SELECT * FROM counted))
+        ''')
+        if self.cursor.fetchone()[0]:
+            problems.append('due_counts does not match the due dates in the words table')
+        return problems
     
     def load_initial_words(self):
         # If no words exist, add initial words
@@ -100,9 +783,13 @@ class Database:
                 ('house', 'خانه')
             ]
             
-            today = datetime.now().strftime('%Y-%m-%d')
-            for eng, per in initial_words:
-                self.add_word(eng, per)
+            self.add_words_bulk(initial_words)
+    
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+        self.conn.close()
     
     def __del__(self):
-        self.conn.close()
\ No newline at end of file
+        self.conn.close()
\ No newline at end of file
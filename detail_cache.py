@@ -0,0 +1,177 @@
+"""Persistent cache of word details (phonetics, examples) in the cache file.
+
+Entries expire after `ttl_days` and the table is capped at `max_entries`,
+evicting the least recently used words first.
+"""
+import json
+import time
+
+from audio_cache import CacheStore, download_audio, play_file
+from database import CACHE_PATH
+
+DAY = 24 * 60 * 60
+# used_at is only rewritten when it is older than this, so reads rarely write
+TOUCH_INTERVAL = 60 * 60
+
+
+def cache_key(word):
+    return word.strip().casefold()
+
+
+class DetailCache:
+    def __init__(self, path=CACHE_PATH, ttl_days=30, max_entries=5000, store=None):
+        self.ttl = ttl_days * DAY
+        self.max_entries = max_entries
+        # Used from worker threads; the lock serializes access to the connection
+        store = store or CacheStore(path)
+        self.lock = store.lock
+        self.conn = store.conn
+        with self.conn:
+            self.conn.execute('''
+                CREATE TABLE IF NOT EXISTS detail_cache (
+                    word TEXT PRIMARY KEY,
+                    data TEXT NOT NULL,
+                    fetched_at INTEGER NOT NULL,
+                    used_at INTEGER NOT NULL
+                )
+            ''')
+            self.conn.execute('''
+                CREATE INDEX IF NOT EXISTS idx_detail_cache_used
+                ON detail_cache (used_at)
+            ''')
+
+    def get(self, word, allow_stale=False):
+        key = cache_key(word)
+        now = int(time.time())
+        with self.lock:
+            row = self.conn.execute(
+                'SELECT data, fetched_at, used_at FROM detail_cache WHERE word = ?', (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            data, fetched_at, used_at = row
+            if not allow_stale and now - fetched_at > self.ttl:
+                return None
+            if now - used_at > TOUCH_INTERVAL:
+                with self.conn:
+                    self.conn.execute('UPDATE detail_cache SET used_at = ? WHERE word = ?', (now, key))
+        return json.loads(data)
+
+    def put(self, word, data):
+        self.put_many([(word, data)])
+
+    def put_many(self, items):
+        """Store (word, data) pairs in one transaction"""
+        now = int(time.time())
+        rows = [(cache_key(word), json.dumps(data, ensure_ascii=False), now, now)
+                for word, data in items]
+        with self.lock, self.conn:
+            self.conn.executemany('''
+                INSERT OR REPLACE INTO detail_cache (word, data, fetched_at, used_at)
+                VALUES (?, ?, ?, ?)
+            ''', rows)
+            count = self.conn.execute('SELECT COUNT(*) FROM detail_cache').fetchone()[0]
+            if count > self.max_entries:
+                self.conn.execute('''
+                    DELETE FROM detail_cache WHERE word IN (
+                        SELECT word FROM detail_cache ORDER BY used_at LIMIT ?
+                    )
+                ''', (count - self.max_entries,))
+
+    def clear(self):
+        with self.lock, self.conn:
+            self.conn.execute('DELETE FROM detail_cache')
+
+
+class CachedAPIService:
+    """APIService with word details served from DetailCache and pronunciations
+    from AudioCache when possible.
+
+    Words missing from the cache are looked up in the offline dictionary
+    pack, if there is one, before the network. With offline=True the network
+    is never used; otherwise a failed details fetch still falls back to an
+    expired entry.
+    """
+
+    def __init__(self, api, cache, audio_cache=None, offline=False, pack=None):
+        self.api = api
+        self.cache = cache
+        self.audio_cache = audio_cache
+        self.offline = offline
+        self.pack = pack
+
+    def local_details(self, word):
+        """Details from the offline pack; cheap enough for the UI thread"""
+        return self.pack.get(word) if self.pack is not None else None
+
+    def get_word_details(self, word):
+        data = self.cache.get(word, allow_stale=self.offline)
+        if data is not None:
+            return data
+        data = self.local_details(word)
+        if data is not None or self.offline:
+            return data
+        return self.fetch_details(word)
+
+    def fetch_details(self, word):
+        data = self.api.get_word_details(word)
+        if data:
+            self.cache.put(word, data)
+            return data
+        return self.cache.get(word, allow_stale=True)
+
+    def get_word_details_batch(self, words):
+        """{word: details or None}; words in neither the cache nor the pack go to the API in one batch"""
+        results = {}
+        missing = []
+        for word in words:
+            results[word] = self.cache.get(word, allow_stale=self.offline)
+            if results[word] is None:
+                results[word] = self.local_details(word)
+            if results[word] is None:
+                missing.append(word)
+        if not missing or self.offline:
+            return results
+
+        fetched = self.api.get_word_details_batch(missing)
+        found = []
+        for word in missing:
+            data = fetched.get(word.strip().lower())
+            if data:
+                results[word] = data
+                found.append((word, data))
+            else:
+                results[word] = self.cache.get(word, allow_stale=True)
+        if found:
+            self.cache.put_many(found)
+        return results
+
+    def fetch_audio(self, word):
+        """Path of the cached pronunciation, downloading it on a miss; None if unavailable"""
+        if self.audio_cache is None:
+            return None
+        path = self.audio_cache.get(word)
+        if path is not None or self.offline:
+            return path
+
+        details = self.get_word_details(word)
+        if details and not details.get('audio') and self.pack is not None:
+            # Pack entries carry no pronunciation URL
+            details = self.fetch_details(word)
+        if not details or not details.get('audio'):
+            return None
+        try:
+            audio = download_audio(details['audio'])
+        except OSError:
+            return None
+        if audio is None:
+            return None
+        return self.audio_cache.put(word, *audio)
+
+    def play_audio(self, word):
+        path = self.fetch_audio(word)
+        if path is not None:
+            return play_file(path)
+        if self.offline:
+            return False
+        return self.api.play_audio(word)
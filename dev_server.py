@@ -0,0 +1,167 @@
+"""Local stand-in for the dictionary API, for development and load checks.
+
+    python dev_server.py --port 8765 [--latency-ms 50] [--fail-rate 0.1]
+
+Serves the same JSON shape as api.dictionaryapi.dev:
+    GET  /api/v2/entries/en/<word>   entries, or 404
+    POST /batch                      {"words": [...]} -> {word: entries or null}
+    GET  /audio/<word>.mp3           a small placeholder file
+    GET  /stats                      request counts since start
+
+Words from the built-in deck have hand-written entries; any other word made
+of letters gets a generated one. Connections are kept alive (HTTP/1.1).
+Point the app at it with
+    VOCAB_API_URL=http://127.0.0.1:8765/api/v2/entries/en/
+    VOCAB_API_BATCH_URL=http://127.0.0.1:8765/batch
+"""
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote
+
+ENTRIES_PATH = '/api/v2/entries/en/'
+BATCH_PATH = '/batch'
+
+WORDS = {
+    'hello': ('həˈləʊ', ['Hello, everyone.', 'She said hello to her neighbour.']),
+    'world': ('wɜːld', ['He travelled around the world.', 'The world is changing fast.']),
+    'book': ('bʊk', ['I am reading a good book.', 'Please book a table for two.']),
+    'learn': ('lɜːn', ['Children learn quickly.', 'I want to learn Persian.']),
+    'study': ('ˈstʌdi', ['She studies every evening.', 'A study of old maps.']),
+    'water': ('ˈwɔːtə', ['Drink more water.', 'The water is cold.']),
+    'friend': ('frɛnd', ['He is my best friend.', 'We became friends at school.']),
+    'happy': ('ˈhæpi', ['I am happy to help.', 'They look happy together.']),
+}
+# A few bytes that start like an MP3 frame; enough for download and cache paths
+AUDIO = b'ID3\x03\x00\x00\x00\x00\x00\x00' + bytes(1024)
+
+
+def entries_for(word, host):
+    if word in WORDS:
+        phonetic, examples = WORDS[word]
+    elif word.isalpha():
+        phonetic = word
+        examples = [f'This is an example with "{word}".', f'Use "{word}" in a sentence.']
+    else:
+        return None
+    return [{
+        'word': word,
+        'phonetic': f'/{phonetic}/',
+        'phonetics': [{'text': f'/{phonetic}/', 'audio': f'http://{host}/audio/{word}.mp3'}],
+        'meanings': [{
+            'partOfSpeech': 'noun',
+            'definitions': [{'definition': f'Meaning of {word}.', 'example': example}
+                            for example in examples],
+        }],
+    }]
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # Headers and body are separate writes; without this each answer waits on a delayed ACK
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self.server.count('GET')
+        if not self.server.admit(self):
+            return
+        host = self.headers.get('Host', '127.0.0.1')
+        if self.path.startswith(ENTRIES_PATH):
+            entries = entries_for(unquote(self.path[len(ENTRIES_PATH):]).lower(), host)
+            if entries is None:
+                self.send_json(404, {'title': 'No Definitions Found'})
+            else:
+                self.send_json(200, entries)
+        elif self.path.startswith('/audio/'):
+            self.send_body(200, AUDIO, 'audio/mpeg')
+        elif self.path == '/stats':
+            self.send_json(200, self.server.stats)
+        else:
+            self.send_json(404, {'title': 'Not Found'})
+
+    def do_POST(self):
+        self.server.count('POST')
+        body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        if not self.server.admit(self):
+            return
+        if self.path != BATCH_PATH:
+            self.send_json(404, {'title': 'Not Found'})
+            return
+        host = self.headers.get('Host', '127.0.0.1')
+        words = json.loads(body or b'{}').get('words', [])
+        self.send_json(200, {word: entries_for(word.lower(), host) for word in words})
+
+    def send_json(self, status, data):
+        self.send_body(status, json.dumps(data, ensure_ascii=False).encode(), 'application/json')
+
+    def send_body(self, status, body, content_type):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class StandInServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, latency_ms=0, fail_rate=0.0, verbose=False):
+        super().__init__(address, Handler)
+        self.latency = latency_ms / 1000
+        self.fail_rate = fail_rate
+        self.verbose = verbose
+        self.lock = threading.Lock()
+        self.stats = {'GET': 0, 'POST': 0, 'connections': 0, 'failed': 0}
+
+    def count(self, method):
+        with self.lock:
+            self.stats[method] += 1
+
+    def process_request(self, request, client_address):
+        with self.lock:
+            self.stats['connections'] += 1
+        super().process_request(request, client_address)
+
+    def admit(self, handler):
+        """Apply the simulated latency; answer 503 for the simulated failures"""
+        if self.latency:
+            time.sleep(self.latency)
+        if self.fail_rate and random.random() < self.fail_rate:
+            with self.lock:
+                self.stats['failed'] += 1
+            handler.send_json(503, {'title': 'Unavailable'})
+            return False
+        return True
+
+
+def start_server(port=0, **options):
+    """Serve on 127.0.0.1 in a background thread; returns (server, base url)"""
+    server = StandInServer(('127.0.0.1', port), **options)
+    threading.Thread(target=server.serve_forever, name='dev-server', daemon=True).start()
+    return server, f'http://127.0.0.1:{server.server_address[1]}'
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Local stand-in dictionary API')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency-ms', type=int, default=0)
+    parser.add_argument('--fail-rate', type=float, default=0.0)
+    parser.add_argument('--verbose', action='store_true')
+    args = parser.parse_args()
+    server = StandInServer(('127.0.0.1', args.port), args.latency_ms, args.fail_rate, args.verbose)
+    print(f'Serving on http://127.0.0.1:{args.port}{ENTRIES_PATH}')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
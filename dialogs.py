@@ -0,0 +1,71 @@
+"""Reusable dialogs and toasts.
+
+Each kind of dialog is built once, with its content and buttons, and reused
+after it has been dismissed: opening it again only rebinds its text and
+callbacks. A second instance is built only when the first is still on
+screen.
+"""
+from kivymd.uix.button import MDRaisedButton
+
+_pool = {}
+_toast = None
+
+
+class Action:
+    """Button callback that can be rebound each time its dialog is reused"""
+
+    def __init__(self):
+        self.callback = None
+
+    def __call__(self, *args):
+        if self.callback is not None:
+            self.callback()
+
+
+def register(kind, builder):
+    """builder() makes a new dialog of this kind when none is free"""
+    _pool[kind] = (builder, [])
+
+
+def acquire(kind):
+    """A dialog of this kind that is not on screen"""
+    builder, dialogs = _pool[kind]
+    for dialog in dialogs:
+        # A dismissed dialog leaves the window once its fade-out has finished
+        if dialog.parent is None:
+            return dialog
+    dialog = builder()
+    dialogs.append(dialog)
+    return dialog
+
+
+def build_alert():
+    from kivymd.uix.dialog import MDDialog
+
+    dialog = MDDialog(
+        title=" ",
+        text=" ",
+        buttons=[MDRaisedButton(text="OK", on_release=lambda x: (dialog.dismiss(), dialog.ok()))]
+    )
+    dialog.ok = Action()
+    return dialog
+
+
+def show_alert(title, text, on_ok=None):
+    dialog = acquire('alert')
+    dialog.title = title
+    dialog.text = text
+    dialog.ok.callback = on_ok
+    dialog.open()
+    return dialog
+
+
+def show_toast(text):
+    global _toast
+    if _toast is None:
+        from kivymd.toast import toast
+        _toast = toast
+    _toast(text)
+
+
+register('alert', build_alert)
@@ -0,0 +1,118 @@
+"""Frame-time monitor and animation governor.
+
+FrameMonitor samples the time between frames through Clock. When too many
+of the recent frames overrun the frame budget it switches to low-power
+mode, and decorative animations started through animate() then jump straight
+to their final values instead of running.
+"""
+from collections import deque
+
+from kivy.animation import Animation
+from kivy.clock import Clock
+from kivy.event import EventDispatcher
+from kivy.logger import Logger
+from kivy.properties import BooleanProperty
+
+_monitor = None
+
+
+class FrameMonitor(EventDispatcher):
+    # True while decorative animations should be skipped
+    low_power = BooleanProperty(False)
+    # User setting: stay in low-power mode regardless of frame times
+    power_saving = BooleanProperty(False)
+
+    def __init__(self, budget=1 / 60, window=120, enter_ratio=0.25, leave_ratio=0.05, **kwargs):
+        super().__init__(**kwargs)
+        self.budget = budget
+        self.enter_ratio = enter_ratio
+        self.leave_ratio = leave_ratio
+        # A frame is slow once it misses the next vsync by half a frame
+        self.slow_after = budget * 1.5
+        self.frames = deque(maxlen=window)
+        self.slow = 0
+        self.overloaded = False
+        self.total_frames = 0
+        self.dropped_frames = 0
+        self.event = None
+
+    def start(self):
+        if self.event is None:
+            self.event = Clock.schedule_interval(self.tick, 0)
+
+    def stop(self):
+        if self.event is not None:
+            self.event.cancel()
+            self.event = None
+
+    def tick(self, dt):
+        if len(self.frames) == self.frames.maxlen and self.frames[0] > self.slow_after:
+            self.slow -= 1
+        self.frames.append(dt)
+        self.total_frames += 1
+        if dt > self.slow_after:
+            self.slow += 1
+            self.dropped_frames += round(dt / self.budget) - 1
+
+        if len(self.frames) == self.frames.maxlen:
+            ratio = self.slow / len(self.frames)
+            if not self.overloaded and ratio >= self.enter_ratio:
+                self.overloaded = True
+                Logger.info(f'Frames: {ratio:.0%} of recent frames over budget, low-power mode on')
+            elif self.overloaded and ratio <= self.leave_ratio:
+                self.overloaded = False
+                Logger.info('Frames: frame times back within budget, low-power mode off')
+        self.low_power = self.power_saving or self.overloaded
+
+    def on_power_saving(self, instance, value):
+        self.low_power = value or self.overloaded
+
+    def stats(self):
+        frames = sorted(self.frames)
+        if not frames:
+            return {'frames': 0, 'dropped': 0, 'fps': 0, 'p95_ms': 0, 'low_power': self.low_power}
+        return {
+            'frames': self.total_frames,
+            'dropped': self.dropped_frames,
+            'fps': round(len(frames) / sum(frames), 1),
+            'p95_ms': round(frames[min(len(frames) - 1, int(len(frames) * 0.95))] * 1000, 1),
+            'low_power': self.low_power,
+        }
+
+
+def get_monitor():
+    global _monitor
+    if _monitor is None:
+        _monitor = FrameMonitor()
+    return _monitor
+
+
+def final_values(anim):
+    """Property values a (possibly sequenced) animation ends on"""
+    if hasattr(anim, 'anim2'):
+        values = final_values(anim.anim1)
+        values.update(final_values(anim.anim2))
+        return values
+    return dict(anim.animated_properties)
+
+
+def animate(widget, anim, decorative=False):
+    """Start anim on widget, replacing running animations of the same properties.
+
+    In low-power mode a decorative animation is not run; its final values
+    are applied at once.
+    """
+    values = final_values(anim)
+    Animation.cancel_all(widget, *values)
+    if decorative and get_monitor().low_power:
+        for name, value in values.items():
+            setattr(widget, name, value)
+        return None
+    anim.start(widget)
+    return anim
+
+
+def stop_animations(*widgets):
+    """Cancel every animation running on these widgets"""
+    for widget in widgets:
+        Animation.cancel_all(widget)
@@ -0,0 +1,95 @@
+"""Streaming readers and writers for word list files (CSV, TSV, JSON, JSON Lines).
+
+Each reader yields (english, persian) pairs one at a time, so a deck of any
+size can be fed straight into Database.add_words_bulk; write_words is the
+reverse and takes the pairs from any iterable.
+"""
+import csv
+import json
+import os
+
+HEADER_NAMES = {'english', 'word', 'en'}
+
+
+def read_delimited(path, delimiter=','):
+    with open(path, encoding='utf-8-sig', newline='') as f:
+        for i, row in enumerate(csv.reader(f, delimiter=delimiter)):
+            if len(row) < 2:
+                continue
+            english, persian = row[0].strip(), row[1].strip()
+            if i == 0 and english.lower() in HEADER_NAMES:
+                continue
+            if english and persian:
+                yield english, persian
+
+
+def _pair(item):
+    if isinstance(item, dict):
+        return item.get('english', ''), item.get('persian', '')
+    return item[0], item[1]
+
+
+def read_json_lines(path):
+    with open(path, encoding='utf-8-sig') as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                english, persian = _pair(json.loads(line))
+                if english and persian:
+                    yield english.strip(), persian.strip()
+
+
+def read_json(path):
+    # A plain JSON document has to be parsed whole; use .jsonl for huge decks
+    with open(path, encoding='utf-8-sig') as f:
+        data = json.load(f)
+    items = data.items() if isinstance(data, dict) else data
+    for item in items:
+        english, persian = _pair(item)
+        if english and persian:
+            yield english.strip(), persian.strip()
+
+
+def read_words(path):
+    ext = os.path.splitext(path)[1].lower()
+    if ext == '.csv':
+        return read_delimited(path, ',')
+    if ext in ('.tsv', '.txt'):
+        return read_delimited(path, '\t')
+    if ext in ('.jsonl', '.ndjson'):
+        return read_json_lines(path)
+    if ext == '.json':
+        return read_json(path)
+    raise ValueError(f'Unsupported word list format: {ext}')
+
+
+def import_file(db, path, chunk_size=5000, progress=None):
+    """Stream a word list file into the database; returns the number of words added"""
+    return db.add_words_bulk(read_words(path), chunk_size, progress)
+
+
+def write_words(path, pairs):
+    """Write (english, persian) pairs in the format given by the extension; returns the count"""
+    ext = os.path.splitext(path)[1].lower()
+    count = 0
+    if ext in ('.csv', '.tsv', '.txt'):
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f, delimiter=',' if ext == '.csv' else '\t')
+            writer.writerow(('english', 'persian'))
+            for pair in pairs:
+                writer.writerow(pair)
+                count += 1
+    elif ext in ('.jsonl', '.ndjson'):
+        with open(path, 'w', encoding='utf-8') as f:
+            for english, persian in pairs:
+                f.write(json.dumps({'english': english, 'persian': persian}, ensure_ascii=False))
+                f.write('\n')
+                count += 1
+    elif ext == '.json':
+        items = [{'english': english, 'persian': persian} for english, persian in pairs]
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(items, f, ensure_ascii=False, indent=1)
+        count = len(items)
+    else:
+        raise ValueError(f'Unsupported word list format: {ext}')
+    return count
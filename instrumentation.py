@@ -0,0 +1,237 @@
+"""Opt-in timing of database calls and screen handlers.
+
+When installed, every Database method and the given screen handlers are
+wrapped with a timer that feeds a rolling latency histogram per call. The
+first time a SQL statement of a new shape runs, its EXPLAIN QUERY PLAN is
+recorded and plans that scan a whole table are flagged. dump() writes it
+all to a JSON metrics file.
+
+Install before the database and the screens are created: Kivy keeps the
+handler it was given when a callback is bound.
+"""
+import bisect
+import functools
+import inspect
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import deque
+
+import database
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds of the histogram buckets; the last bucket is everything slower
+BUCKETS_MS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000)
+WINDOW = 500
+
+_LITERALS = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_LISTS = re.compile(r'\?(?:\s*,\s*\?)+')
+_SPACE = re.compile(r'\s+')
+_FULL_SCAN = re.compile(r'^SCAN (?:TABLE )?\w+(?: AS \w+)?$')
+_PLANNED = ('SELECT', 'INSERT', 'UPDATE', 'DELETE', 'REPLACE', 'WITH')
+
+_active = None
+
+
+def statement_shape(sql):
+    """sql with its literal values and IN lists replaced by placeholders"""
+    shape = _LITERALS.sub('?', sql)
+    shape = _LISTS.sub('?, ...', shape)
+    return _SPACE.sub(' ', shape).strip()
+
+
+class Histogram:
+    """Latencies of the last `window` calls in buckets, plus lifetime totals"""
+
+    def __init__(self, window=WINDOW):
+        self.samples = deque(maxlen=window)
+        self.buckets = [0] * (len(BUCKETS_MS) + 1)
+        self.calls = 0
+        self.total_ms = 0.0
+        self.lock = threading.Lock()
+
+    def add(self, ms):
+        with self.lock:
+            if len(self.samples) == self.samples.maxlen:
+                self.buckets[bisect.bisect_left(BUCKETS_MS, self.samples[0])] -= 1
+            self.samples.append(ms)
+            self.buckets[bisect.bisect_left(BUCKETS_MS, ms)] += 1
+            self.calls += 1
+            self.total_ms += ms
+
+    def summary(self):
+        with self.lock:
+            samples = sorted(self.samples)
+            buckets = list(self.buckets)
+            calls, total_ms = self.calls, self.total_ms
+        if not samples:
+            return {'calls': 0}
+        labels = [f'<={bound}ms' for bound in BUCKETS_MS] + [f'>{BUCKETS_MS[-1]}ms']
+        return {
+            'calls': calls,
+            'mean_ms': round(total_ms / calls, 3),
+            'p50_ms': round(samples[len(samples) // 2], 3),
+            'p95_ms': round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 3),
+            'max_ms': round(samples[-1], 3),
+            'histogram': {label: count for label, count in zip(labels, buckets) if count},
+        }
+
+
+class QueryPlans:
+    """EXPLAIN QUERY PLAN of each statement shape, taken on its first run.
+
+    Statements arrive from the trace callbacks of the app's connections and
+    are explained on a separate connection, after the call that ran them.
+    """
+
+    def __init__(self, path, connect):
+        self.conn = connect(path, check_same_thread=False)
+        self.lock = threading.Lock()
+        # Bounded so a large executemany does not pile up statements
+        self.pending = deque(maxlen=256)
+        self.plans = {}
+
+    def trace(self, sql):
+        self.pending.append(sql)
+
+    def process(self):
+        while self.pending:
+            try:
+                sql = self.pending.popleft()
+            except IndexError:
+                break
+            if sql.lstrip()[:7].split(' ')[0].upper() not in _PLANNED:
+                continue
+            shape = statement_shape(sql)
+            if shape in self.plans:
+                continue
+            with self.lock:
+                try:
+                    rows = self.conn.execute('EXPLAIN QUERY PLAN ' + sql).fetchall()
+                except sqlite3.Error as e:
+                    self.plans[shape] = {'error': str(e)}
+                    continue
+            plan = [row[3] for row in rows]
+            full_scan = any(_FULL_SCAN.match(detail) for detail in plan)
+            self.plans[shape] = {'plan': plan, 'full_scan': full_scan}
+            if full_scan:
+                logger.warning('Full table scan: %s -- %s', shape, '; '.join(plan))
+
+    def close(self):
+        self.conn.close()
+
+
+class Instrumentation:
+    def __init__(self, path):
+        self.histograms = {}
+        self.connect = database.connect
+        self.plans = QueryPlans(path, self.connect)
+        self.wrapped = []
+        self.started = time.time()
+
+    def traced_connect(self, *args, **kwargs):
+        conn = self.connect(*args, **kwargs)
+        conn.set_trace_callback(self.plans.trace)
+        return conn
+
+    def wrap(self, cls, names=None):
+        """Time the given methods of cls, or all of its own methods"""
+        if names is None:
+            names = [name for name, value in vars(cls).items()
+                     if inspect.isfunction(value) and not name.startswith('__')]
+        for name in names:
+            original = vars(cls)[name]
+            self.wrapped.append((cls, name, original))
+            setattr(cls, name, self.timed(f'{cls.__name__}.{name}', original))
+
+    def timed(self, label, fn):
+        histogram = self.histograms.setdefault(label, Histogram())
+        plans = self.plans
+
+        if inspect.isgeneratorfunction(fn):
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                return self.timed_iter(histogram, fn(*args, **kwargs))
+            return wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                histogram.add((time.perf_counter() - started) * 1000)
+                if plans.pending:
+                    plans.process()
+        return wrapper
+
+    def timed_iter(self, histogram, items):
+        # Time spent producing items, recorded once the caller is done
+        elapsed = 0.0
+        try:
+            while True:
+                started = time.perf_counter()
+                try:
+                    item = next(items)
+                except StopIteration:
+                    return
+                finally:
+                    elapsed += time.perf_counter() - started
+                yield item
+        finally:
+            histogram.add(elapsed * 1000)
+            if self.plans.pending:
+                self.plans.process()
+
+    def snapshot(self):
+        return {
+            'started': time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(self.started)),
+            'written': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'calls': {label: histogram.summary()
+                      for label, histogram in sorted(self.histograms.items()) if histogram.calls},
+            'full_scans': sorted(shape for shape, plan in self.plans.plans.items()
+                                 if plan.get('full_scan')),
+            'query_plans': self.plans.plans,
+        }
+
+    def uninstall(self):
+        for cls, name, original in reversed(self.wrapped):
+            setattr(cls, name, original)
+        self.wrapped = []
+        database.connect = self.connect
+        self.plans.close()
+
+
+def install(path=database.DB_PATH, handlers=()):
+    """Start timing Database methods and handlers, a list of (class, method names)"""
+    global _active
+    if _active is None:
+        _active = Instrumentation(path)
+        database.connect = _active.traced_connect
+        _active.wrap(database.Database)
+        for cls, names in handlers:
+            _active.wrap(cls, names)
+    return _active
+
+
+def active():
+    return _active
+
+
+def dump(path, extra=None):
+    """Write the metrics collected so far to path as JSON; returns path"""
+    if _active is None:
+        return None
+    metrics = _active.snapshot()
+    if extra:
+        metrics.update(extra)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(metrics, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+    return path
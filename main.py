@@ -1,22 +1,30 @@
+import startup_timeline as timeline
 from kivymd.app import MDApp
 from kivymd.uix.screen import MDScreen
 from kivymd.uix.screenmanager import MDScreenManager
-from kivymd.uix.button import MDRaisedButton, MDFlatButton, MDIconButton, MDFloatingActionButton
+from kivymd.uix.button import MDRaisedButton, MDFlatButton, MDFloatingActionButton
 from kivymd.uix.card import MDCard
 from kivymd.uix.label import MDLabel
-from kivymd.uix.dialog import MDDialog
 from kivymd.uix.boxlayout import MDBoxLayout
-from kivymd.uix.textfield import MDTextField
 from kivymd.uix.progressbar import MDProgressBar
-from kivymd.uix.list import MDList, ThreeLineAvatarIconListItem, IconLeftWidget, IconRightWidget
-from kivy.uix.scrollview import ScrollView
 from kivy.metrics import dp
 from kivy.animation import Animation
-from kivy.properties import StringProperty, NumericProperty, BooleanProperty
+from kivy.properties import StringProperty, NumericProperty
 from kivy.clock import Clock
+from kivy.logger import Logger
+timeline.mark('kivy imports')
+import os
+import sys
+import time
 from datetime import datetime
-from database import Database
-from api_service import APIService
+from database import get_database
+import dialogs
+from frame_monitor import get_monitor, animate
+timeline.mark('app imports')
+
+# Dialog widgets, text fields, switches, the practice and word list screens
+# and the services behind them (HTTP client, caches, prefetcher, workers) are
+# imported where they are first used, so their modules load after the first frame
 
 # برای صدا
 try:
@@ -29,11 +37,14 @@ except:
 
 
 class HomeScreen(MDScreen):
+    # Most words in one practice session
+    DAILY_WORDS = 10
+    
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.db = Database()
-        self.current_words = []
-        self.current_index = 0
+        self.db = get_database()
+        dialogs.register('add_word', self.build_add_word_dialog)
+        dialogs.register('settings', self.build_settings_dialog)
         self.build_ui()
         
     def build_ui(self):
@@ -62,7 +73,7 @@ class HomeScreen(MDScreen):
         stats = self.db.get_statistics()
         
         self.stats_label = MDLabel(
-            text=f"[size=18]✅ Learned: {stats['learned']}[/size]",
+            text=f"[size=18]✅ Learned: {stats['learned']}   🎯 {stats['accuracy']}%[/size]",
             markup=True,
             halign="center",
             theme_text_color="Custom",
@@ -70,7 +81,7 @@ class HomeScreen(MDScreen):
         )
         
         self.learning_label = MDLabel(
-            text=f"[size=18]📖 Learning: {stats['learning']}[/size]",
+            text=f"[size=18]📖 Learning: {stats['learning']}   ⏰ Due: {stats['due_today']}[/size]",
             markup=True,
             halign="center",
             theme_text_color="Custom",
@@ -152,58 +163,79 @@ class HomeScreen(MDScreen):
         
         self.add_widget(layout)
         
-        # انیمیشن دکمه Start
-        self.animate_start_button()
+        # The start button pulses only while this screen is visible
+        get_monitor().bind(low_power=self.on_low_power)
     
     def animate_start_button(self):
         """انیمیشن pulse برای دکمه شروع"""
         anim = Animation(elevation=12, duration=0.6) + Animation(elevation=4, duration=0.6)
         anim.repeat = True
-        anim.start(self.start_btn)
+        animate(self.start_btn, anim, decorative=True)
+    
+    def stop_start_button(self):
+        Animation.cancel_all(self.start_btn, 'elevation')
+        self.start_btn.elevation = 4
+    
+    def on_low_power(self, monitor, low_power):
+        if low_power:
+            self.stop_start_button()
+        elif self.manager and self.manager.current == self.name:
+            self.animate_start_button()
     
     def start_daily_practice(self, *args):
         # انیمیشن کلیک
         anim = Animation(size_hint_x=0.8, duration=0.1) + Animation(size_hint_x=0.85, duration=0.1)
-        anim.start(self.start_btn)
+        animate(self.start_btn, anim, decorative=True)
         
-        self.current_words = self.db.get_daily_words(10)
-        if not self.current_words:
+        from practice_session import PracticeSession
+        # At most the daily count; refill streams the due words up to it
+        session = PracticeSession(self.db, limit=self.DAILY_WORDS)
+        if session.next_word() is None:
             self.show_dialog("✅ Great Job!", "🎉 No words to practice today!\nYou're doing awesome!")
             return
         
-        self.current_index = 0
-        self.manager.get_screen('practice').load_word(self.current_words[self.current_index])
+        self.manager.get_screen('practice').start_session(session)
         self.manager.transition.direction = 'left'
         self.manager.current = 'practice'
     
     def show_add_word_dialog(self, *args):
+        self.add_dialog = dialogs.acquire('add_word')
+        self.english_input, self.persian_input = self.add_dialog.fields
+        self.english_input.text = ""
+        self.persian_input.text = ""
+        self.add_dialog.open()
+    
+    def build_add_word_dialog(self):
+        from kivymd.uix.dialog import MDDialog
+        from kivymd.uix.textfield import MDTextField
+        
         content = MDBoxLayout(orientation='vertical', spacing=dp(15), size_hint_y=None, height=dp(180))
         
-        self.english_input = MDTextField(
+        english_input = MDTextField(
             hint_text="English Word",
             mode="rectangle",
             size_hint_y=None,
             height=dp(50)
         )
         
-        self.persian_input = MDTextField(
+        persian_input = MDTextField(
             hint_text="Persian Meaning",
             mode="rectangle",
             size_hint_y=None,
             height=dp(50)
         )
         
-        content.add_widget(self.english_input)
-        content.add_widget(self.persian_input)
+        content.add_widget(english_input)
+        content.add_widget(persian_input)
         
-        self.add_dialog = MDDialog(
+        dialog = MDDialog(
             title="Add New Word",
             type="custom",
             content_cls=content,
             buttons=[
                 MDFlatButton(
                     text="CANCEL",
-                    on_release=lambda x: self.add_dialog.dismiss()
+                    on_release=lambda x: dialog.dismiss()
                 ),
                 MDRaisedButton(
                     text="ADD",
@@ -212,7 +244,8 @@ class HomeScreen(MDScreen):
                 )
             ]
         )
-        self.add_dialog.open()
+        dialog.fields = (english_input, persian_input)
+        return dialog
     
     def add_new_word(self, *args):
         english = self.english_input.text.strip()
@@ -232,13 +265,57 @@ class HomeScreen(MDScreen):
         self.manager.current = 'words_list'
     
     def show_settings(self, *args):
-        content = MDBoxLayout(orientation='vertical', spacing=dp(10), size_hint_y=None, height=dp(150))
+        from services import get_api
+        dialog = dialogs.acquire('settings')
+        dialog.offline_switch.active = get_api().offline
+        dialog.power_switch.active = get_monitor().power_saving
+        dialog.metrics_switch.active = os.path.exists(MDApp.get_running_app().metrics_flag())
+        dialog.open()
+    
+    def build_settings_dialog(self):
+        from kivymd.uix.dialog import MDDialog
+        from kivymd.uix.selectioncontrol import MDSwitch
+        from services import get_api
+        
+        content = MDBoxLayout(orientation='vertical', spacing=dp(10), size_hint_y=None, height=dp(340))
         
         content.add_widget(MDLabel(text="Daily words count:", size_hint_y=None, height=dp(30)))
         
-        slider_label = MDLabel(text="10 words", halign="center", size_hint_y=None, height=dp(30))
+        slider_label = MDLabel(text=f"{self.DAILY_WORDS} words", halign="center", size_hint_y=None, height=dp(30))
         content.add_widget(slider_label)
         
+        # Offline-first: only cached word details, no network
+        offline_row = MDBoxLayout(size_hint_y=None, height=dp(40))
+        offline_row.add_widget(MDLabel(text="Offline mode (cached details only)"))
+        offline_switch = MDSwitch()
+        offline_switch.bind(active=lambda instance, value: setattr(get_api(), 'offline', value))
+        offline_row.add_widget(offline_switch)
+        content.add_widget(offline_row)
+        
+        # Skip decorative animations even when frames are within budget
+        power_row = MDBoxLayout(size_hint_y=None, height=dp(40))
+        power_row.add_widget(MDLabel(text="Low-power animations"))
+        power_switch = MDSwitch()
+        power_switch.bind(active=lambda instance, value: setattr(get_monitor(), 'power_saving', value))
+        power_row.add_widget(power_switch)
+        content.add_widget(power_row)
+        
+        # Opt-in query/handler timing; installed at startup, so it applies after a restart
+        metrics_row = MDBoxLayout(size_hint_y=None, height=dp(40))
+        metrics_row.add_widget(MDLabel(text="Record performance metrics (after restart)"))
+        metrics_switch = MDSwitch()
+        metrics_switch.bind(
+            active=lambda instance, value: MDApp.get_running_app().set_metrics_enabled(value)
+        )
+        metrics_row.add_widget(metrics_switch)
+        content.add_widget(metrics_row)
+        
+        content.add_widget(MDFlatButton(
+            text="EXPORT METRICS",
+            pos_hint={'center_x': 0.5},
+            on_release=lambda x: self.export_metrics()
+        ))
+        
         dialog = MDDialog(
             title="⚙️ Settings",
             type="custom",
@@ -247,586 +324,76 @@ class HomeScreen(MDScreen):
                 MDRaisedButton(text="OK", on_release=lambda x: dialog.dismiss())
             ]
         )
-        dialog.open()
+        dialog.offline_switch = offline_switch
+        dialog.power_switch = power_switch
+        dialog.metrics_switch = metrics_switch
+        return dialog
+    
+    def export_metrics(self):
+        app = MDApp.get_running_app()
+        path = app.dump_metrics(app.export_directory())
+        if path:
+            self.show_toast(f"Metrics saved to {path}")
+        else:
+            self.show_toast("Metrics are off; enable them and restart the app")
     
     def show_dialog(self, title, text):
-        dialog = MDDialog(
-            title=title,
-            text=text,
-            buttons=[MDRaisedButton(text="OK", on_release=lambda x: dialog.dismiss())]
-        )
-        dialog.open()
+        dialogs.show_alert(title, text)
     
     def show_toast(self, text):
-        from kivymd.toast import toast
-        toast(text)
+        dialogs.show_toast(text)
     
     def update_stats(self):
         stats = self.db.get_statistics()
-        self.stats_label.text = f"[size=18]✅ Learned: {stats['learned']}[/size]"
-        self.learning_label.text = f"[size=18]📖 Learning: {stats['learning']}[/size]"
+        self.stats_label.text = f"[size=18]✅ Learned: {stats['learned']}   🎯 {stats['accuracy']}%[/size]"
+        self.learning_label.text = f"[size=18]📖 Learning: {stats['learning']}   ⏰ Due: {stats['due_today']}[/size]"
         
         total = stats['learned'] + stats['learning']
         percentage = (stats['learned'] / total * 100) if total > 0 else 0
         
         # انیمیشن پروگرس بار
         anim = Animation(value=percentage, duration=0.5)
-        anim.start(self.progress_bar)
+        animate(self.progress_bar, anim)
     
     def on_enter(self):
         """هر بار که به این صفحه برمیگردیم آمار رو آپدیت کن"""
         self.update_stats()
-
-
-class FlippableCard(MDCard):
-    """کارت قابل چرخش برای نمایش کلمه"""
-    is_flipped = BooleanProperty(False)
+        self.animate_start_button()
     
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.size_hint = (0.95, None)
-        self.height = dp(250)
-        self.pos_hint = {'center_x': 0.5}
-        self.elevation = 10
-        self.radius = [20, 20, 20, 20]
-        self.padding = dp(20)
-        
-    def flip(self):
-        """چرخش کارت"""
-        self.is_flipped = not self.is_flipped
-        
-        # انیمیشن چرخش
-        if self.is_flipped:
-            anim = Animation(opacity=0, duration=0.2) + Animation(opacity=1, duration=0.2)
-        else:
-            anim = Animation(opacity=0, duration=0.2) + Animation(opacity=1, duration=0.2)
-        
-        anim.start(self)
+    def on_leave(self):
+        self.stop_start_button()
 
 
-class PracticeScreen(MDScreen):
+class LazyScreenManager(MDScreenManager):
+    """ScreenManager that builds each registered screen the first time it is needed"""
+    
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.db = Database()
-        self.api = APIService()
-        self.current_word = None
-        self.show_answer = False
-        self.build_ui()
-    
-    def build_ui(self):
-        main_layout = MDBoxLayout(orientation='vertical', spacing=dp(10), padding=dp(10))
-        
-        # Top bar با Progress
-        top_bar = MDBoxLayout(size_hint_y=None, height=dp(80), spacing=dp(10))
-        
-        self.back_btn = MDIconButton(
-            icon="arrow-left",
-            pos_hint={'center_y': 0.5},
-            on_release=self.go_back
-        )
-        
-        progress_layout = MDBoxLayout(orientation='vertical', spacing=dp(5))
-        
-        self.word_number = MDLabel(
-            text="Word 1 of 10",
-            halign="center",
-            font_style="H6"
-        )
-        
-        self.progress_bar = MDProgressBar(
-            value=10,
-            size_hint_y=None,
-            height=dp(6)
-        )
-        
-        progress_layout.add_widget(self.word_number)
-        progress_layout.add_widget(self.progress_bar)
-        
-        top_bar.add_widget(self.back_btn)
-        top_bar.add_widget(progress_layout)
-        
-        # Scrollable content
-        scroll = ScrollView()
-        self.content_layout = MDBoxLayout(
-            orientation='vertical',
-            spacing=dp(15),
-            adaptive_height=True,
-            padding=dp(10)
-        )
-        
-        # کارت کلمه با قابلیت Flip
-        self.word_card = MDCard(
-            size_hint=(0.95, None),
-            height=dp(280),
-            pos_hint={'center_x': 0.5},
-            elevation=12,
-            radius=[20, 20, 20, 20],
-            padding=dp(20),
-            md_bg_color=(0.95, 0.95, 1, 1)
-        )
-        
-        self.word_card_layout = MDBoxLayout(orientation='vertical', spacing=dp(15))
-        
-        # English word
-        word_header = MDBoxLayout(size_hint_y=None, height=dp(60), spacing=dp(10))
-        
-        self.english_label = MDLabel(
-            text="",
-            halign="center",
-            font_style="H3",
-            theme_text_color="Primary",
-            markup=True
-        )
-        
-        # دکمه اسپیکر با شمارنده
-        speaker_layout = MDBoxLayout(
-            orientation='vertical',
-            size_hint_x=None,
-            width=dp(60),
-            spacing=dp(2)
-        )
-        
-        self.speaker_btn = MDIconButton(
-            icon="volume-high",
-            icon_size="40sp",
-            theme_icon_color="Custom",
-            icon_color=(0.2, 0.6, 0.9, 1),
-            on_release=self.play_pronunciation
-        )
-        
-        self.play_count_label = MDLabel(
-            text="🔊 0",
-            halign="center",
-            font_style="Caption",
-            size_hint_y=None,
-            height=dp(20)
-        )
-        
-        speaker_layout.add_widget(self.speaker_btn)
-        speaker_layout.add_widget(self.play_count_label)
-        
-        word_header.add_widget(MDLabel())  # Spacer
-        word_header.add_widget(self.english_label)
-        word_header.add_widget(speaker_layout)
-        
-        # Phonetic
-        self.phonetic_label = MDLabel(
-            text="",
-            halign="center",
-            font_style="Subtitle1",
-            theme_text_color="Secondary",
-            size_hint_y=None,
-            height=dp(30)
-        )
-        
-        # Persian (مخفی تا زمان فشردن Show Answer)
-        self.persian_label = MDLabel(
-            text="",
-            halign="center",
-            font_style="H5",
-            theme_text_color="Custom",
-            text_color=(0.2, 0.7, 0.2, 1),
-            opacity=0,
-            size_hint_y=None,
-            height=dp(40)
-        )
-        
-        # دکمه Show Answer
-        self.show_answer_btn = MDRaisedButton(
-            text="👁️ Show Answer",
-            pos_hint={'center_x': 0.5},
-            size_hint_x=0.7,
-            md_bg_color=(0.3, 0.5, 0.7, 1),
-            on_release=self.toggle_answer
-        )
-        
-        self.word_card_layout.add_widget(word_header)
-        self.word_card_layout.add_widget(self.phonetic_label)
-        self.word_card_layout.add_widget(self.persian_label)
-        self.word_card_layout.add_widget(MDLabel())  # Spacer
-        self.word_card_layout.add_widget(self.show_answer_btn)
-        
-        self.word_card.add_widget(self.word_card_layout)
-        
-        # کارت مثال‌ها
-        self.examples_card = MDCard(
-            size_hint=(0.95, None),
-            height=dp(220),
-            pos_hint={'center_x': 0.5},
-            elevation=8,
-            radius=[15, 15, 15, 15],
-            padding=dp(15),
-            md_bg_color=(1, 0.98, 0.95, 1)
-        )
-        
-        examples_layout = MDBoxLayout(orientation='vertical', spacing=dp(12))
-        
-        examples_title = MDLabel(
-            text="📝 Example Sentences:",
-            font_style="Subtitle1",
-            size_hint_y=None,
-            height=dp(30),
-            bold=True,
-            theme_text_color="Primary"
-        )
-        
-        self.example1_label = MDLabel(
-            text="Loading...",
-            size_hint_y=None,
-            height=dp(70),
-            theme_text_color="Secondary"
-        )
-        
-        self.example2_label = MDLabel(
-            text="",
-            size_hint_y=None,
-            height=dp(70),
-            theme_text_color="Secondary"
-        )
-        
-        examples_layout.add_widget(examples_title)
-        examples_layout.add_widget(self.example1_label)
-        examples_layout.add_widget(self.example2_label)
-        
-        self.examples_card.add_widget(examples_layout)
-        
-        # Add to content
-        self.content_layout.add_widget(self.word_card)
-        self.content_layout.add_widget(self.examples_card)
-        
-        scroll.add_widget(self.content_layout)
-        
-        # Action buttons با آیکون
-        buttons_layout = MDBoxLayout(
-            spacing=dp(15),
-            size_hint_y=None,
-            height=dp(70),
-            padding=[dp(15), 0, dp(15), dp(10)]
-        )
-        
-        self.know_btn = MDRaisedButton(
-            text="✅ I Know It",
-            size_hint_x=0.5,
-            md_bg_color=(0.2, 0.8, 0.2, 1),
-            elevation=6,
-            on_release=self.mark_as_known
-        )
-        
-        self.dont_know_btn = MDRaisedButton(
-            text="❌ Don't Know",
-            size_hint_x=0.5,
-            md_bg_color=(0.9, 0.3, 0.2, 1),
-            elevation=6,
-            on_release=self.mark_as_unknown
-        )
-        
-        buttons_layout.add_widget(self.know_btn)
-        buttons_layout.add_widget(self.dont_know_btn)
-        
-        main_layout.add_widget(top_bar)
-        main_layout.add_widget(scroll)
-        main_layout.add_widget(buttons_layout)
-        
-        self.add_widget(main_layout)
-        
-        # متغیر شمارش پخش صدا
-        self.play_count = 0
+        self.factories = {}
     
-    def load_word(self, word):
-        self.current_word = word
-        self.show_answer = False
-        self.play_count = 0
-        
-        # Reset UI
-        self.english_label.text = f"[b]{word['english']}[/b]"
-        self.persian_label.text = word['persian']
-        self.persian_label.opacity = 0
-        self.show_answer_btn.text = "👁️ Show Answer"
-        self.play_count_label.text = "🔊 0"
-        
-        # Update progress
-        home_screen = self.manager.get_screen('home')
-        current_idx = home_screen.current_index + 1
-        total = len(home_screen.current_words)
-        self.word_number.text = f"Word {current_idx} of {total}"
-        
-        progress_value = (current_idx / total) * 100
-        anim = Animation(value=progress_value, duration=0.3)
-        anim.start(self.progress_bar)
-        
-        # انیمیشن ورود کارت
-        self.word_card.opacity = 0
-        self.examples_card.opacity = 0
-        Animation(opacity=1, duration=0.5).start(self.word_card)
-        Animation(opacity=1, duration=0.5, transition='out_bounce').start(self.examples_card)
-        
-        # Load details
-        self.load_word_details(word['english'])
+    def register(self, name, factory):
+        self.factories[name] = factory
     
-    def load_word_details(self, word):
-        self.phonetic_label.text = "Loading..."
-        self.example1_label.text = "Loading examples..."
-        self.example2_label.text = ""
-        
-        # Get from API
-        data = self.api.get_word_details(word)
-        
-        if data:
-            self.phonetic_label.text = f"/{data.get('phonetic', '')}/".replace("//", "")
-            
-            examples = data.get('examples', [])
-            self.example1_label.text = f"1. {examples[0]}" if len(examples) > 0 else "No examples available"
-            self.example2_label.text = f"2. {examples[1]}" if len(examples) > 1 else ""
-        else:
-            self.phonetic_label.text = ""
-            self.example1_label.text = "⚠️ Could not load examples\n(Check internet connection)"
-            self.example2_label.text = ""
+    def has_screen(self, name):
+        return name in self.factories or super().has_screen(name)
     
-    def toggle_answer(self, *args):
-        """نمایش/مخفی کردن جواب"""
-        if not self.show_answer:
-            # نمایش جواب
-            anim = Animation(opacity=1, duration=0.3)
-            anim.start(self.persian_label)
-            self.show_answer_btn.text = "👁️ Hide Answer"
-            self.show_answer = True
-        else:
-            # مخفی کردن جواب
-            anim = Animation(opacity=0, duration=0.3)
-            anim.start(self.persian_label)
-            self.show_answer_btn.text = "👁️ Show Answer"
-            self.show_answer = False
-    
-    def play_pronunciation(self, *args):
-        """پخش صدا (هر تعداد باری که بخواد)"""
-        if self.current_word:
-            # انیمیشن دکمه
-            anim = (Animation(icon_size="50sp", duration=0.1) + 
-                   Animation(icon_size="40sp", duration=0.1))
-            anim.start(self.speaker_btn)
-            
-            # افزایش شمارنده
-            self.play_count += 1
-            self.play_count_label.text = f"🔊 {self.play_count}"
-            
-            # پخش صدا
-            success = self.api.play_audio(self.current_word['english'])
-            if not success:
-                self.show_toast("⚠️ Could not play audio")
-    
-    def show_toast(self, text):
-        from kivymd.toast import toast
-        toast(text)
-    
-    def mark_as_known(self, *args):
-        # انیمیشن موفقیت
-        anim = Animation(md_bg_color=(0.3, 1, 0.3, 1), duration=0.2) + \
-               Animation(md_bg_color=(0.2, 0.8, 0.2, 1), duration=0.2)
-        anim.start(self.know_btn)
-        
-        self.db.update_word_status(self.current_word['id'], True)
-        Clock.schedule_once(lambda dt: self.next_word(), 0.3)
-    
-    def mark_as_unknown(self, *args):
-        # انیمیشن
-        anim = Animation(md_bg_color=(1, 0.4, 0.3, 1), duration=0.2) + \
-               Animation(md_bg_color=(0.9, 0.3, 0.2, 1), duration=0.2)
-        anim.start(self.dont_know_btn)
-        
-        self.db.update_word_status(self.current_word['id'], False)
-        Clock.schedule_once(lambda dt: self.next_word(), 0.3)
-    
-    def next_word(self):
-        home_screen = self.manager.get_screen('home')
-        home_screen.current_index += 1
-        
-        if home_screen.current_index < len(home_screen.current_words):
-            self.load_word(home_screen.current_words[home_screen.current_index])
-        else:
-            self.show_completion_dialog()
-    
-    def show_completion_dialog(self):
-        stats = self.db.get_statistics()
-        
-        content = MDBoxLayout(
-            orientation='vertical',
-            spacing=dp(15),
-            size_hint_y=None,
-            height=dp(150),
-            padding=dp(20)
-        )
-        
-        congrats = MDLabel(
-            text="🎉 Awesome Work!",
-            halign="center",
-            font_style="H5",
-            size_hint_y=None,
-            height=dp(40)
-        )
-        
-        stats_label = MDLabel(
-            text=f"Total Learned: {stats['learned']} words\nKeep going! 💪",
-            halign="center",
-            theme_text_color="Secondary"
-        )
-        
-        content.add_widget(congrats)
-        content.add_widget(stats_label)
-        
-        dialog = MDDialog(
-            title="Practice Completed!",
-            type="custom",
-            content_cls=content,
-            buttons=[
-                MDRaisedButton(
-                    text="CONTINUE",
-                    md_bg_color=(0.2, 0.7, 0.3, 1),
-                    on_release=lambda x: self.go_home(dialog)
-                )
-            ]
-        )
-        dialog.open()
-    
-    def go_back(self, *args):
-        self.manager.transition.direction = 'right'
-        self.manager.current = 'home'
-    
-    def go_home(self, dialog):
-        dialog.dismiss()
-        self.manager.transition.direction = 'right'
-        self.manager.current = 'home'
+    def get_screen(self, name):
+        factory = self.factories.pop(name, None)
+        if factory is not None:
+            started = time.perf_counter()
+            self.add_widget(factory(name))
+            Logger.info(f'Startup: built screen {name!r} in {(time.perf_counter() - started) * 1000:.1f} ms')
+        return super().get_screen(name)
 
 
-class WordsListScreen(MDScreen):
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.db = Database()
-        self.api = APIService()
-        self.build_ui()
-    
-    def build_ui(self):
-        layout = MDBoxLayout(orientation='vertical')
-        
-        # Header
-        header = MDCard(
-            size_hint_y=None,
-            height=dp(70),
-            elevation=5,
-            md_bg_color=(0.1, 0.5, 0.8, 1),
-            radius=[0, 0, 0, 0]
-        )
-        
-        header_layout = MDBoxLayout(padding=dp(10), spacing=dp(10))
-        
-        back_btn = MDIconButton(
-            icon="arrow-left",
-            theme_icon_color="Custom",
-            icon_color=(1, 1, 1, 1),
-            on_release=lambda x: self.go_back()
-        )
-        
-        title = MDLabel(
-            text="My Word List",
-            font_style="H5",
-            halign="left",
-            theme_text_color="Custom",
-            text_color=(1, 1, 1, 1)
-        )
-        
-        header_layout.add_widget(back_btn)
-        header_layout.add_widget(title)
-        
-        header.add_widget(header_layout)
-        
-        # Search box
-        search_card = MDCard(
-            size_hint_y=None,
-            height=dp(70),
-            padding=dp(10),
-            elevation=2
-        )
-        
-        self.search_field = MDTextField(
-            hint_text="🔍 Search words...",
-            mode="rectangle",
-            on_text=self.search_words
-        )
-        
-        search_card.add_widget(self.search_field)
-        
-        # Words list
-        self.scroll = ScrollView()
-        self.words_list = MDList(spacing=dp(5))
-        
-        self.scroll.add_widget(self.words_list)
-        
-        layout.add_widget(header)
-        layout.add_widget(search_card)
-        layout.add_widget(self.scroll)
-        
-        self.add_widget(layout)
-    
-    def load_words(self):
-        self.words_list.clear_widgets()
-        words = self.db.get_all_words()
-        
-        for word in words:
-            status_icon = "check-circle" if word['learned'] else "book-open-variant"
-            status_color = (0.2, 0.8, 0.2, 1) if word['learned'] else (0.9, 0.6, 0.2, 1)
-            
-            item = ThreeLineAvatarIconListItem(
-                IconLeftWidget(
-                    icon=status_icon,
-                    theme_icon_color="Custom",
-                    icon_color=status_color
-                ),
-                text=f"[b]{word['english']}[/b]",
-                secondary_text=word['persian'],
-                tertiary_text=f"Reviewed: {word.get('last_review', 'Never')}",
-                on_release=lambda x, w=word: self.play_word_audio(w['english'])
-            )
-            
-            # Add speaker button
-            speaker_icon = IconRightWidget(
-                icon="volume-high",
-                on_release=lambda x, w=word: self.play_word_audio(w['english'])
-            )
-            item.add_widget(speaker_icon)
-            
-            self.words_list.add_widget(item)
-    
-    def search_words(self, instance, text):
-        """جستجوی کلمات"""
-        self.words_list.clear_widgets()
-        words = self.db.get_all_words()
-        
-        filtered = [w for w in words if text.lower() in w['english'].lower() or 
-                   text.lower() in w['persian'].lower()]
-        
-        for word in filtered:
-            status_icon = "check-circle" if word['learned'] else "book-open-variant"
-            status_color = (0.2, 0.8, 0.2, 1) if word['learned'] else (0.9, 0.6, 0.2, 1)
-            
-            item = ThreeLineAvatarIconListItem(
-                IconLeftWidget(
-                    icon=status_icon,
-                    theme_icon_color="Custom",
-                    icon_color=status_color
-                ),
-                text=f"[b]{word['english']}[/b]",
-                secondary_text=word['persian'],
-                tertiary_text=f"Reviewed: {word.get('last_review', 'Never')}"
-            )
-            
-            self.words_list.add_widget(item)
-    
-    def play_word_audio(self, word):
-        """پخش صدای کلمه از لیست"""
-        self.api.play_audio(word)
-    
-    def go_back(self):
-        self.manager.transition.direction = 'right'
-        self.manager.current = 'home'
+def build_practice_screen(name):
+    from practice import PracticeScreen
+    return PracticeScreen(name=name)
+
+
+def build_words_list_screen(name):
+    from words_list import WordsListScreen
+    return WordsListScreen(name=name)
 
 
 class VocabApp(MDApp):
@@ -834,13 +401,89 @@ class VocabApp(MDApp):
         self.theme_cls.theme_style = "Light"
         self.theme_cls.primary_palette = "Blue"
         self.theme_cls.accent_palette = "Amber"
-        
-        sm = MDScreenManager()
+        timeline.mark('theme')
+        
+        if self.metrics_enabled():
+            # Before any screen exists, so the bound handlers and the search
+            # trigger built in WordsListScreen.__init__ are the timed ones.
+            # search_words only re-arms that trigger; run_search does the work
+            import instrumentation
+            from practice import PracticeScreen
+            from words_list import WordsListScreen
+            instrumentation.install(handlers=[
+                (HomeScreen, ['start_daily_practice']),
+                (PracticeScreen, ['load_word', 'mark_as_known', 'mark_as_unknown']),
+                (WordsListScreen, ['load_words', 'load_more_words', 'run_search']),
+            ])
+        
+        sm = LazyScreenManager()
         sm.add_widget(HomeScreen(name='home'))
-        sm.add_widget(PracticeScreen(name='practice'))
-        sm.add_widget(WordsListScreen(name='words_list'))
+        timeline.mark('home screen')
+        sm.register('practice', build_practice_screen)
+        sm.register('words_list', build_words_list_screen)
         
         return sm
+    
+    def on_start(self):
+        # Runs once the first frame is up
+        Clock.schedule_once(lambda dt: self.report_startup())
+        get_monitor().start()
+        # Keep the answer log bounded: old answers become per-word summaries
+        get_database().compact_in_background()
+    
+    def report_startup(self):
+        timeline.mark('first frame')
+        timeline.report()
+    
+    def metrics_flag(self):
+        return os.path.join(self.user_data_dir, 'metrics_enabled')
+    
+    def metrics_enabled(self):
+        return os.environ.get('VOCAB_METRICS') == '1' or os.path.exists(self.metrics_flag())
+    
+    def set_metrics_enabled(self, enabled):
+        flag = self.metrics_flag()
+        if enabled:
+            open(flag, 'w').close()
+        elif os.path.exists(flag):
+            os.remove(flag)
+    
+    def dump_metrics(self, directory=None):
+        """Write the collected metrics to a file; None when metrics are off"""
+        instrumentation = sys.modules.get('instrumentation')
+        if instrumentation is None:
+            # Never installed in this run
+            return None
+        path = os.path.join(directory or self.user_data_dir, 'vocab_metrics.json')
+        return instrumentation.dump(path, {'frames': get_monitor().stats()})
+    
+    def export_directory(self):
+        """Where exported files can be reached from outside the app"""
+        if ANDROID:
+            try:
+                from android.storage import primary_external_storage_path
+                directory = os.path.join(primary_external_storage_path(), 'Documents')
+                os.makedirs(directory, exist_ok=True)
+                return directory
+            except Exception:
+                pass
+        return self.user_data_dir
+    
+    def on_pause(self):
+        # Android may kill a paused app without on_stop: make the answers durable now
+        get_database().flush(wait=True, timeout=3)
+        self.dump_metrics()
+        return True
+    
+    def on_stop(self):
+        monitor = get_monitor()
+        monitor.stop()
+        Logger.info(f'Frames: {monitor.stats()}')
+        self.dump_metrics()
+        workers = sys.modules.get('workers')
+        if workers is not None:
+            workers.shutdown()
+        get_database().close()
 
 if __name__ == '__main__':
     VocabApp().run()
@@ -0,0 +1,153 @@
+"""Offline dictionary pack: word details read straight from a memory-mapped file.
+
+    python offline_dict.py build dictionary.vdp words.jsonl
+    python offline_dict.py build dictionary.vdp vocabulary_cache.db
+    python offline_dict.py lookup dictionary.vdp hello
+
+A pack holds phonetics and example sentences for a set of headwords. The
+source is JSON Lines of {"word", "phonetic", "examples"} or the app's cache
+file, whose cached word details are packed. Layout, little-endian:
+
+    header   b'VDP1', count u32, index offset u32, records offset u32
+    index    count x (key offset u32, record offset u32), sorted by key bytes
+    keys     u8 length + casefolded UTF-8 headword
+    records  u16 length + UTF-8 fields joined by \\x1f: phonetic, examples...
+
+Lookups binary-search the index in the mapping, so opening a pack reads
+nothing but the header and memory is only touched on the pages searched.
+"""
+import json
+import mmap
+import os
+import sqlite3
+import struct
+import sys
+
+MAGIC = b'VDP1'
+HEADER = struct.Struct('<4sIII')
+ENTRY = struct.Struct('<II')
+SEPARATOR = '\x1f'
+MAX_EXAMPLES = 2
+
+
+def pack_key(word):
+    return word.strip().casefold().encode('utf-8')
+
+
+class OfflineDictionary:
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.count, self.index_offset, self.records_offset = HEADER.unpack_from(self.data)
+        if magic != MAGIC:
+            self.data.close()
+            raise ValueError(f'{path} is not a dictionary pack')
+
+    @classmethod
+    def open(cls, path):
+        """The pack at path, or None when there is no usable pack"""
+        try:
+            return cls(path)
+        except (OSError, ValueError, struct.error):
+            return None
+
+    def key_at(self, i):
+        key_offset, _ = ENTRY.unpack_from(self.data, self.index_offset + i * ENTRY.size)
+        length = self.data[key_offset]
+        return self.data[key_offset + 1:key_offset + 1 + length]
+
+    def get(self, word):
+        """Details of word ({'phonetic', 'examples', 'audio': None}) or None"""
+        key = pack_key(word)
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            if self.key_at(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low == self.count or self.key_at(low) != key:
+            return None
+
+        _, record_offset = ENTRY.unpack_from(self.data, self.index_offset + low * ENTRY.size)
+        (length,) = struct.unpack_from('<H', self.data, record_offset)
+        fields = self.data[record_offset + 2:record_offset + 2 + length].decode('utf-8').split(SEPARATOR)
+        return {'phonetic': fields[0], 'examples': fields[1:], 'audio': None}
+
+    def __len__(self):
+        return self.count
+
+    def close(self):
+        self.data.close()
+
+
+def build(path, entries):
+    """Write a pack from (word, details) pairs; the last details for a word win. Returns the count"""
+    records = {}
+    for word, details in entries:
+        key = pack_key(word)
+        # JSON Lines sources keep the dictionary's /slashes/; parse_entries drops them
+        phonetic = (details.get('phonetic') or '').strip('/')
+        fields = [phonetic] + list(details.get('examples') or [])[:MAX_EXAMPLES]
+        record = SEPARATOR.join(field.replace(SEPARATOR, ' ') for field in fields).encode('utf-8')
+        if 0 < len(key) < 256 and len(record) < 65536:
+            records[key] = record
+
+    keys = sorted(records)
+    index_offset = HEADER.size
+    keys_offset = index_offset + len(keys) * ENTRY.size
+    records_offset = keys_offset + sum(1 + len(key) for key in keys)
+
+    index = bytearray()
+    key_data = bytearray()
+    record_data = bytearray()
+    for key in keys:
+        index += ENTRY.pack(keys_offset + len(key_data), records_offset + len(record_data))
+        key_data += bytes((len(key),)) + key
+        record_data += struct.pack('<H', len(records[key])) + records[key]
+
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, len(keys), index_offset, records_offset))
+        f.write(index)
+        f.write(key_data)
+        f.write(record_data)
+    os.replace(tmp_path, path)
+    return len(keys)
+
+
+def read_source(path):
+    """(word, details) pairs from JSON Lines or from the app's cache file"""
+    if path.endswith('.db'):
+        conn = sqlite3.connect(path)
+        try:
+            for word, data in conn.execute('SELECT word, data FROM detail_cache'):
+                yield word, json.loads(data)
+        finally:
+            conn.close()
+        return
+    with open(path, encoding='utf-8-sig') as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                item = json.loads(line)
+                yield item['word'], item
+
+
+def main(argv=None):
+    args = sys.argv[1:] if argv is None else argv
+    if len(args) == 3 and args[0] == 'build':
+        count = build(args[1], read_source(args[2]))
+        print(f'Packed {count} words into {args[1]} ({os.path.getsize(args[1])} bytes)')
+        return 0
+    if len(args) == 3 and args[0] == 'lookup':
+        pack = OfflineDictionary(args[1])
+        print(json.dumps(pack.get(args[2]), ensure_ascii=False))
+        return 0
+    print(__doc__.split('\n\n')[1], file=sys.stderr)
+    return 2
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,504 @@
+import time
+
+from kivymd.uix.screen import MDScreen
+from kivymd.uix.button import MDRaisedButton, MDIconButton
+from kivymd.uix.card import MDCard
+from kivymd.uix.label import MDLabel
+from kivymd.uix.boxlayout import MDBoxLayout
+from kivymd.uix.progressbar import MDProgressBar
+from kivy.uix.scrollview import ScrollView
+from kivy.metrics import dp
+from kivy.animation import Animation
+from kivy.properties import BooleanProperty
+from kivy.clock import Clock
+from database import get_database
+from services import get_api
+from audio_cache import play_file
+from workers import run_in_background
+from prefetch import Prefetcher
+import dialogs
+from frame_monitor import animate, stop_animations
+
+
+class FlippableCard(MDCard):
+    """کارت قابل چرخش برای نمایش کلمه"""
+    is_flipped = BooleanProperty(False)
+    
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.size_hint = (0.95, None)
+        self.height = dp(250)
+        self.pos_hint = {'center_x': 0.5}
+        self.elevation = 10
+        self.radius = [20, 20, 20, 20]
+        self.padding = dp(20)
+        
+    def flip(self):
+        """چرخش کارت"""
+        self.is_flipped = not self.is_flipped
+        
+        # انیمیشن چرخش
+        if self.is_flipped:
+            anim = Animation(opacity=0, duration=0.2) + Animation(opacity=1, duration=0.2)
+        else:
+            anim = Animation(opacity=0, duration=0.2) + Animation(opacity=1, duration=0.2)
+        
+        animate(self, anim, decorative=True)
+
+
+class PracticeScreen(MDScreen):
+    # How many upcoming cards get their details and audio fetched ahead
+    PREFETCH_DEPTH = 3
+    
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.db = get_database()
+        self.api = get_api()
+        self.prefetcher = Prefetcher(self.api, depth=self.PREFETCH_DEPTH)
+        self.session = None
+        self.current_word = None
+        self.show_answer = False
+        self.shown_at = 0
+        self.details_token = 0
+        dialogs.register('completion', self.build_completion_dialog)
+        self.build_ui()
+    
+    def build_ui(self):
+        main_layout = MDBoxLayout(orientation='vertical', spacing=dp(10), padding=dp(10))
+        
+        # Top bar با Progress
+        top_bar = MDBoxLayout(size_hint_y=None, height=dp(80), spacing=dp(10))
+        
+        self.back_btn = MDIconButton(
+            icon="arrow-left",
+            pos_hint={'center_y': 0.5},
+            on_release=self.go_back
+        )
+        
+        progress_layout = MDBoxLayout(orientation='vertical', spacing=dp(5))
+        
+        self.word_number = MDLabel(
+            text="Word 1 of 10",
+            halign="center",
+            font_style="H6"
+        )
+        
+        self.progress_bar = MDProgressBar(
+            value=10,
+            size_hint_y=None,
+            height=dp(6)
+        )
+        
+        progress_layout.add_widget(self.word_number)
+        progress_layout.add_widget(self.progress_bar)
+        
+        top_bar.add_widget(self.back_btn)
+        top_bar.add_widget(progress_layout)
+        
+        # Scrollable content
+        scroll = ScrollView()
+        self.content_layout = MDBoxLayout(
+            orientation='vertical',
+            spacing=dp(15),
+            adaptive_height=True,
+            padding=dp(10)
+        )
+        
+        # کارت کلمه با قابلیت Flip
+        self.word_card = MDCard(
+            size_hint=(0.95, None),
+            height=dp(280),
+            pos_hint={'center_x': 0.5},
+            elevation=12,
+            radius=[20, 20, 20, 20],
+            padding=dp(20),
+            md_bg_color=(0.95, 0.95, 1, 1)
+        )
+        
+        self.word_card_layout = MDBoxLayout(orientation='vertical', spacing=dp(15))
+        
+        # English word
+        word_header = MDBoxLayout(size_hint_y=None, height=dp(60), spacing=dp(10))
+        
+        self.english_label = MDLabel(
+            text="",
+            halign="center",
+            font_style="H3",
+            theme_text_color="Primary",
+            markup=True
+        )
+        
+        # دکمه اسپیکر با شمارنده
+        speaker_layout = MDBoxLayout(
+            orientation='vertical',
+            size_hint_x=None,
+            width=dp(60),
+            spacing=dp(2)
+        )
+        
+        self.speaker_btn = MDIconButton(
+            icon="volume-high",
+            icon_size="40sp",
+            theme_icon_color="Custom",
+            icon_color=(0.2, 0.6, 0.9, 1),
+            on_release=self.play_pronunciation
+        )
+        
+        self.play_count_label = MDLabel(
+            text="🔊 0",
+            halign="center",
+            font_style="Caption",
+            size_hint_y=None,
+            height=dp(20)
+        )
+        
+        speaker_layout.add_widget(self.speaker_btn)
+        speaker_layout.add_widget(self.play_count_label)
+        
+        word_header.add_widget(MDLabel())  # Spacer
+        word_header.add_widget(self.english_label)
+        word_header.add_widget(speaker_layout)
+        
+        # Phonetic
+        self.phonetic_label = MDLabel(
+            text="",
+            halign="center",
+            font_style="Subtitle1",
+            theme_text_color="Secondary",
+            size_hint_y=None,
+            height=dp(30)
+        )
+        
+        # Persian (مخفی تا زمان فشردن Show Answer)
+        self.persian_label = MDLabel(
+            text="",
+            halign="center",
+            font_style="H5",
+            theme_text_color="Custom",
+            text_color=(0.2, 0.7, 0.2, 1),
+            opacity=0,
+            size_hint_y=None,
+            height=dp(40)
+        )
+        
+        # دکمه Show Answer
+        self.show_answer_btn = MDRaisedButton(
+            text="👁️ Show Answer",
+            pos_hint={'center_x': 0.5},
+            size_hint_x=0.7,
+            md_bg_color=(0.3, 0.5, 0.7, 1),
+            on_release=self.toggle_answer
+        )
+        
+        self.word_card_layout.add_widget(word_header)
+        self.word_card_layout.add_widget(self.phonetic_label)
+        self.word_card_layout.add_widget(self.persian_label)
+        self.word_card_layout.add_widget(MDLabel())  # Spacer
+        self.word_card_layout.add_widget(self.show_answer_btn)
+        
+        self.word_card.add_widget(self.word_card_layout)
+        
+        # کارت مثال‌ها
+        self.examples_card = MDCard(
+            size_hint=(0.95, None),
+            height=dp(220),
+            pos_hint={'center_x': 0.5},
+            elevation=8,
+            radius=[15, 15, 15, 15],
+            padding=dp(15),
+            md_bg_color=(1, 0.98, 0.95, 1)
+        )
+        
+        examples_layout = MDBoxLayout(orientation='vertical', spacing=dp(12))
+        
+        examples_title = MDLabel(
+            text="📝 Example Sentences:",
+            font_style="Subtitle1",
+            size_hint_y=None,
+            height=dp(30),
+            bold=True,
+            theme_text_color="Primary"
+        )
+        
+        self.example1_label = MDLabel(
+            text="Loading...",
+            size_hint_y=None,
+            height=dp(70),
+            theme_text_color="Secondary"
+        )
+        
+        self.example2_label = MDLabel(
+            text="",
+            size_hint_y=None,
+            height=dp(70),
+            theme_text_color="Secondary"
+        )
+        
+        examples_layout.add_widget(examples_title)
+        examples_layout.add_widget(self.example1_label)
+        examples_layout.add_widget(self.example2_label)
+        
+        self.examples_card.add_widget(examples_layout)
+        
+        # Add to content
+        self.content_layout.add_widget(self.word_card)
+        self.content_layout.add_widget(self.examples_card)
+        
+        scroll.add_widget(self.content_layout)
+        
+        # Action buttons با آیکون
+        buttons_layout = MDBoxLayout(
+            spacing=dp(15),
+            size_hint_y=None,
+            height=dp(70),
+            padding=[dp(15), 0, dp(15), dp(10)]
+        )
+        
+        self.know_btn = MDRaisedButton(
+            text="✅ I Know It",
+            size_hint_x=0.5,
+            md_bg_color=(0.2, 0.8, 0.2, 1),
+            elevation=6,
+            on_release=self.mark_as_known
+        )
+        
+        self.dont_know_btn = MDRaisedButton(
+            text="❌ Don't Know",
+            size_hint_x=0.5,
+            md_bg_color=(0.9, 0.3, 0.2, 1),
+            elevation=6,
+            on_release=self.mark_as_unknown
+        )
+        
+        buttons_layout.add_widget(self.know_btn)
+        buttons_layout.add_widget(self.dont_know_btn)
+        
+        main_layout.add_widget(top_bar)
+        main_layout.add_widget(scroll)
+        main_layout.add_widget(buttons_layout)
+        
+        self.add_widget(main_layout)
+        
+        # متغیر شمارش پخش صدا
+        self.play_count = 0
+    
+    def start_session(self, session):
+        self.session = session
+        self.load_word(session.current)
+    
+    def load_word(self, word):
+        self.current_word = word
+        self.show_answer = False
+        self.play_count = 0
+        
+        # Reset UI
+        self.english_label.text = f"[b]{word.english}[/b]"
+        self.persian_label.text = word.persian
+        self.persian_label.opacity = 0
+        self.show_answer_btn.text = "👁️ Show Answer"
+        self.play_count_label.text = "🔊 0"
+        
+        # Update progress; the total grows while more due words stream in
+        current_idx = self.session.position
+        total = self.session.total
+        more = "" if self.session.exhausted else "+"
+        self.word_number.text = f"Word {current_idx} of {total}{more}"
+        
+        progress_value = (current_idx / total) * 100
+        anim = Animation(value=progress_value, duration=0.3)
+        animate(self.progress_bar, anim)
+        
+        # انیمیشن ورود کارت
+        self.word_card.opacity = 0
+        self.examples_card.opacity = 0
+        animate(self.word_card, Animation(opacity=1, duration=0.5), decorative=True)
+        animate(self.examples_card, Animation(opacity=1, duration=0.5, transition='out_bounce'),
+                decorative=True)
+        
+        # Load details
+        self.load_word_details(word.english)
+        self.shown_at = time.monotonic()
+        
+        # Warm the next cards while this one is on screen
+        upcoming = self.session.upcoming(self.PREFETCH_DEPTH)
+        self.prefetcher.prefetch([w.english for w in upcoming])
+    
+    def load_word_details(self, word):
+        self.phonetic_label.text = "Loading..."
+        self.example1_label.text = "Loading examples..."
+        self.example2_label.text = ""
+        
+        self.details_token += 1
+        token = self.details_token
+        
+        prefetched = self.prefetcher.get_details(word) or self.api.local_details(word)
+        if prefetched:
+            self.show_word_details(token, prefetched)
+            return
+        
+        # Get from API off the UI thread; the token ties the answer to this card
+        run_in_background(
+            self.api.get_word_details, word,
+            on_done=lambda data: self.show_word_details(token, data)
+        )
+    
+    def show_word_details(self, token, data):
+        if token != self.details_token:
+            # Late answer for a card that was already skipped
+            return
+        
+        if data:
+            self.phonetic_label.text = f"/{data.get('phonetic', '')}/".replace("//", "")
+            
+            examples = data.get('examples', [])
+            self.example1_label.text = f"1. {examples[0]}" if len(examples) > 0 else "No examples available"
+            self.example2_label.text = f"2. {examples[1]}" if len(examples) > 1 else ""
+        else:
+            self.phonetic_label.text = ""
+            self.example1_label.text = "⚠️ Could not load examples\n(Check internet connection)"
+            self.example2_label.text = ""
+    
+    def toggle_answer(self, *args):
+        """نمایش/مخفی کردن جواب"""
+        if not self.show_answer:
+            # نمایش جواب
+            anim = Animation(opacity=1, duration=0.3)
+            animate(self.persian_label, anim)
+            self.show_answer_btn.text = "👁️ Hide Answer"
+            self.show_answer = True
+        else:
+            # مخفی کردن جواب
+            anim = Animation(opacity=0, duration=0.3)
+            animate(self.persian_label, anim)
+            self.show_answer_btn.text = "👁️ Show Answer"
+            self.show_answer = False
+    
+    def play_pronunciation(self, *args):
+        """پخش صدا (هر تعداد باری که بخواد)"""
+        if self.current_word:
+            # انیمیشن دکمه
+            anim = (Animation(icon_size="50sp", duration=0.1) + 
+                   Animation(icon_size="40sp", duration=0.1))
+            animate(self.speaker_btn, anim, decorative=True)
+            
+            # افزایش شمارنده
+            self.play_count += 1
+            self.play_count_label.text = f"🔊 {self.play_count}"
+            
+            # پخش صدا؛ a cache miss downloads the file off the UI thread
+            run_in_background(self.api.fetch_audio, self.current_word.english,
+                              on_done=self.play_fetched_audio)
+    
+    def play_fetched_audio(self, path):
+        if path is None or not play_file(path):
+            self.show_toast("⚠️ Could not play audio")
+    
+    def show_toast(self, text):
+        dialogs.show_toast(text)
+    
+    def response_ms(self):
+        """زمان پاسخ از نمایش کارت"""
+        return int((time.monotonic() - self.shown_at) * 1000)
+    
+    def mark_as_known(self, *args):
+        if self.session.current is None:
+            return  # already answered; the next card is on its way
+        # انیمیشن موفقیت
+        anim = Animation(md_bg_color=(0.3, 1, 0.3, 1), duration=0.2) + \
+               Animation(md_bg_color=(0.2, 0.8, 0.2, 1), duration=0.2)
+        animate(self.know_btn, anim, decorative=True)
+        
+        self.session.answer(True, self.response_ms())
+        Clock.schedule_once(lambda dt: self.next_word(), 0.3)
+    
+    def mark_as_unknown(self, *args):
+        if self.session.current is None:
+            return  # already answered; the next card is on its way
+        # انیمیشن
+        anim = Animation(md_bg_color=(1, 0.4, 0.3, 1), duration=0.2) + \
+               Animation(md_bg_color=(0.9, 0.3, 0.2, 1), duration=0.2)
+        animate(self.dont_know_btn, anim, decorative=True)
+        
+        self.session.answer(False, self.response_ms())
+        Clock.schedule_once(lambda dt: self.next_word(), 0.3)
+    
+    def next_word(self):
+        word = self.session.next_word()
+        if word is not None:
+            self.load_word(word)
+        else:
+            self.show_completion_dialog()
+    
+    def show_completion_dialog(self):
+        # End of session: read the stats once the writer has committed the
+        # queued answers, without waiting for it on the UI thread
+        self.db.flush(wait=False,
+                      on_done=lambda: Clock.schedule_once(self.open_completion_dialog))
+    
+    def open_completion_dialog(self, dt):
+        stats = self.db.get_statistics()
+        
+        dialog = dialogs.acquire('completion')
+        dialog.stats_label.text = f"Total Learned: {stats['learned']} words\nKeep going! 💪"
+        dialog.open()
+    
+    def build_completion_dialog(self):
+        from kivymd.uix.dialog import MDDialog
+        
+        content = MDBoxLayout(
+            orientation='vertical',
+            spacing=dp(15),
+            size_hint_y=None,
+            height=dp(150),
+            padding=dp(20)
+        )
+        
+        congrats = MDLabel(
+            text="🎉 Awesome Work!",
+            halign="center",
+            font_style="H5",
+            size_hint_y=None,
+            height=dp(40)
+        )
+        
+        stats_label = MDLabel(
+            halign="center",
+            theme_text_color="Secondary"
+        )
+        
+        content.add_widget(congrats)
+        content.add_widget(stats_label)
+        
+        dialog = MDDialog(
+            title="Practice Completed!",
+            type="custom",
+            content_cls=content,
+            buttons=[
+                MDRaisedButton(
+                    text="CONTINUE",
+                    md_bg_color=(0.2, 0.7, 0.3, 1),
+                    on_release=lambda x: self.go_home(dialog)
+                )
+            ]
+        )
+        dialog.stats_label = stats_label
+        return dialog
+    
+    def on_leave(self):
+        # load_word resets these when the screen is shown again
+        stop_animations(self.word_card, self.examples_card, self.progress_bar, self.persian_label)
+    
+    def go_back(self, *args):
+        self.db.flush(wait=False, on_done=lambda: Clock.schedule_once(self.refresh_home))
+        self.manager.transition.direction = 'right'
+        self.manager.current = 'home'
+    
+    def refresh_home(self, dt):
+        """Home showed its stats before the last answers were committed"""
+        if self.manager.current == 'home':
+            self.manager.get_screen('home').update_stats()
+    
+    def go_home(self, dialog):
+        dialog.dismiss()
+        self.manager.transition.direction = 'right'
+        self.manager.current = 'home'
@@ -0,0 +1,81 @@
+"""Word queue for one practice session, independent of the UI.
+
+The session starts with one small batch of due words and tops the queue up
+from the database as the user advances, so a long session never waits on
+one large query. Missed words come back a few cards later.
+"""
+from collections import deque
+from itertools import islice
+
+
+class PracticeSession:
+    def __init__(self, db, batch_size=10, refill_below=3, limit=None,
+                 requeue_gap=4, max_requeues=2):
+        self.db = db
+        self.batch_size = batch_size
+        # Fetch the next batch once this few words are left in the queue
+        self.refill_below = refill_below
+        # Most distinct words in the session; None means every due word
+        self.limit = limit
+        self.requeue_gap = requeue_gap
+        self.max_requeues = max_requeues
+        self.queue = deque()
+        self.seen = set()
+        self.requeues = {}
+        self.exhausted = False
+        self.current = None
+        self.answered = 0
+        self.correct = 0
+
+    def refill(self):
+        if self.exhausted:
+            return
+        size = self.batch_size
+        if self.limit is not None:
+            size = min(size, self.limit - len(self.seen))
+        words = self.db.get_daily_words(size, exclude=self.seen) if size > 0 else []
+        for word in words:
+            self.seen.add(word.id)
+            self.queue.append(word)
+        if len(words) < self.batch_size or len(self.seen) == self.limit:
+            self.exhausted = True
+
+    def next_word(self):
+        """Move to the next word; None when the session is over"""
+        if len(self.queue) < self.refill_below:
+            self.refill()
+        self.current = self.queue.popleft() if self.queue else None
+        return self.current
+
+    def answer(self, is_correct, response_ms=None):
+        """Grade the current word and queue it again later if it was missed"""
+        word = self.current
+        if word is None:
+            return
+        self.current = None
+        self.db.update_word_status(word.id, is_correct, response_ms)
+        self.answered += 1
+        if is_correct:
+            self.correct += 1
+            return
+
+        requeues = self.requeues.get(word.id, 0)
+        if requeues < self.max_requeues:
+            self.requeues[word.id] = requeues + 1
+            if len(self.queue) < self.requeue_gap:
+                self.refill()
+            self.queue.insert(min(self.requeue_gap, len(self.queue)), word)
+
+    def upcoming(self, count):
+        """The next `count` queued words, without taking them"""
+        return list(islice(self.queue, count))
+
+    @property
+    def position(self):
+        """1-based number of the current card"""
+        return self.answered + 1
+
+    @property
+    def total(self):
+        """Cards known so far; grows while more due words stream in"""
+        return self.answered + len(self.queue) + (self.current is not None)
@@ -0,0 +1,67 @@
+"""Warm word details and pronunciation audio for the next cards of a session.
+
+The upcoming words are fetched as one batch on the worker pool, one batch
+at a time. Audio goes to the on-disk AudioCache through the API service;
+details are also kept in memory up to `max_bytes` (least recently used
+first out).
+"""
+import json
+from collections import OrderedDict
+
+from workers import run_in_background
+
+
+class Prefetcher:
+    def __init__(self, api, depth=3, max_bytes=256 * 1024):
+        self.api = api
+        self.depth = depth
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.used_bytes = 0
+        self.wanted = []
+        self.in_flight = set()
+
+    def prefetch(self, words):
+        """Warm the first `depth` of the upcoming words, nearest first"""
+        self.wanted = [w for w in words[:self.depth] if w not in self.entries]
+        self._pump()
+
+    def _pump(self):
+        if self.in_flight:
+            return
+        words = [w for w in self.wanted if w not in self.entries]
+        if not words:
+            return
+        self.in_flight = set(words)
+        run_in_background(self._fetch, words,
+                          on_done=lambda result, w=words: self._store(w, result))
+
+    def _fetch(self, words):
+        # Worker thread
+        details = self.api.get_word_details_batch(words)
+        for word in words:
+            if details.get(word):
+                self.api.fetch_audio(word)
+        return details
+
+    def _store(self, words, results):
+        self.in_flight = set()
+        for word, details in (results or {}).items():
+            if not details or word in self.entries:
+                continue
+            size = len(json.dumps(details))
+            if size <= self.max_bytes:
+                self.entries[word] = (details, size)
+                self.used_bytes += size
+                while self.used_bytes > self.max_bytes:
+                    _, (_, old_size) = self.entries.popitem(last=False)
+                    self.used_bytes -= old_size
+        self.wanted = [w for w in self.wanted if w not in words]
+        self._pump()
+
+    def get_details(self, word):
+        entry = self.entries.get(word)
+        if entry is None:
+            return None
+        self.entries.move_to_end(word)
+        return entry[0]
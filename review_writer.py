@@ -0,0 +1,122 @@
+import logging
+import queue
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class FlushRequest(threading.Event):
+    """Set by the writer once the answers before it are committed; then calls on_done()"""
+
+    def __init__(self, on_done=None):
+        super().__init__()
+        self.on_done = on_done
+
+    def set(self):
+        super().set()
+        if self.on_done is not None:
+            try:
+                self.on_done()
+            except Exception:
+                logger.exception('Flush callback failed')
+
+
+class ReviewWriter(threading.Thread):
+    """Background thread that owns the write connection for practice answers.
+
+    Grading events are queued by the UI thread and written in one transaction
+    per flush interval, so an answer never waits on an fsync.
+    """
+
+    def __init__(self, open_connection, apply_review, flush_interval=2.0):
+        super().__init__(name='review-writer', daemon=True)
+        self.open_connection = open_connection
+        self.apply_review = apply_review
+        self.flush_interval = flush_interval
+        self.events = queue.Queue()
+        self.start()
+
+    def submit(self, word_id, is_correct, today, response_ms=None):
+        self.events.put((word_id, is_correct, today, response_ms))
+
+    def flush(self, wait=True, timeout=None, on_done=None):
+        """Commit everything submitted so far; with wait=True block until it is on disk.
+
+        Returns True once the answers are committed, False if that did not
+        happen within timeout (or wait=False). Failed writes are retried.
+        on_done() is called on this thread after the commit.
+        """
+        done = FlushRequest(on_done)
+        self.events.put(done)
+        if wait:
+            return done.wait(timeout)
+        return False
+
+    def run_task(self, task):
+        """Run task(connection) on this thread between answer writes, e.g. maintenance"""
+        self.events.put(task)
+
+    def close(self):
+        self.events.put(_STOP)
+        self.join()
+
+    def run(self):
+        conn = self.open_connection()
+        pending = []
+        barriers = []
+        deadline = None
+        running = True
+
+        while running:
+            timeout = None if deadline is None else max(0, deadline - time.monotonic())
+            try:
+                item = self.events.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            if item is _STOP:
+                running = False
+            elif isinstance(item, threading.Event):
+                barriers.append(item)
+            elif callable(item):
+                try:
+                    item(conn)
+                except Exception:
+                    logger.exception('Writer task failed')
+                continue
+            elif item is not None:
+                pending.append(item)
+                if deadline is None:
+                    deadline = time.monotonic() + self.flush_interval
+
+            # Write on timeout, on a flush request or on shutdown
+            if item is None or barriers or not running:
+                if pending and not self.write(conn, pending):
+                    if running:
+                        # Keep the answers, and the flush requests waiting on them, for a retry
+                        deadline = time.monotonic() + self.flush_interval
+                        continue
+                    logger.error('Lost %d reviews at shutdown', len(pending))
+                    break
+                pending = []
+                deadline = None
+                for barrier in barriers:
+                    barrier.set()
+                barriers = []
+
+        conn.close()
+
+    def write(self, conn, events):
+        cursor = conn.cursor()
+        try:
+            with conn:
+                for word_id, is_correct, today, response_ms in events:
+                    self.apply_review(cursor, word_id, is_correct, today, response_ms)
+        except Exception:
+            # The transaction was rolled back, so the same events can be written again
+            logger.exception('Could not write %d reviews', len(events))
+            return False
+        return True
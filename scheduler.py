@@ -0,0 +1,75 @@
+"""Spaced-repetition scheduling (SM-2 style).
+
+A word's state is its streak of correct answers (correct_count) and its
+ease factor. The interval to the next review is a closed-form function of
+those two, so the same math works per answer and, with NumPy, over a whole
+deck at once. Every interval after a correct answer is scaled by
+ease / initial_ease: words at the initial ease get first_interval and
+second_interval days, easier words longer and harder words shorter ones.
+"""
+from datetime import date, timedelta
+
+
+class SM2Scheduler:
+    def __init__(self, first_interval=3, second_interval=6, lapse_interval=1,
+                 initial_ease=2.5, min_ease=1.3, max_ease=3.5,
+                 ease_bonus=0.05, ease_penalty=0.2, learned_after=3, max_interval=3650):
+        self.first_interval = first_interval
+        self.second_interval = second_interval
+        self.lapse_interval = lapse_interval
+        self.initial_ease = initial_ease
+        self.min_ease = min_ease
+        self.max_ease = max_ease
+        self.ease_bonus = ease_bonus
+        self.ease_penalty = ease_penalty
+        self.learned_after = learned_after
+        self.max_interval = max_interval
+
+    def interval(self, streak, ease):
+        """Days until the next review after `streak` correct answers in a row"""
+        if streak <= 0:
+            return self.lapse_interval
+        base = self.first_interval if streak == 1 else self.second_interval * ease ** (streak - 2)
+        return min(self.max_interval, max(1, round(base * ease / self.initial_ease)))
+
+    def review(self, streak, ease, is_correct):
+        """New (streak, ease, interval_days, learned) after one answer"""
+        if is_correct:
+            streak += 1
+            ease = min(self.max_ease, ease + self.ease_bonus)
+        else:
+            streak = 0
+            ease = max(self.min_ease, ease - self.ease_penalty)
+        return streak, ease, self.interval(streak, ease), streak >= self.learned_after
+
+    def reschedule_batch(self, streaks, eases, last_reviews):
+        """next_review dates and learned flags for many words at once.
+
+        last_reviews are ISO dates. Uses NumPy when it is installed and a
+        plain loop otherwise.
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            return self._reschedule_loop(streaks, eases, last_reviews)
+
+        streaks = np.asarray(streaks, dtype=np.int64)
+        eases = np.asarray(eases, dtype=np.float64)
+        days = np.asarray(last_reviews, dtype='datetime64[D]')
+
+        base = np.where(streaks == 1, self.first_interval,
+                        self.second_interval * eases ** np.maximum(streaks - 2, 0))
+        scaled = np.minimum(self.max_interval,
+                            np.maximum(1, np.round(base * eases / self.initial_ease)))
+        intervals = np.where(streaks <= 0, self.lapse_interval, scaled)
+        next_reviews = days + intervals.astype('timedelta64[D]')
+        return next_reviews.astype(str).tolist(), (streaks >= self.learned_after).tolist()
+
+    def _reschedule_loop(self, streaks, eases, last_reviews):
+        next_reviews = []
+        learned = []
+        for streak, ease, last_review in zip(streaks, eases, last_reviews):
+            day = date.fromisoformat(last_review) + timedelta(days=self.interval(streak, ease))
+            next_reviews.append(day.isoformat())
+            learned.append(streak >= self.learned_after)
+        return next_reviews, learned
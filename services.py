@@ -0,0 +1,26 @@
+"""Shared service objects used by several screens."""
+import os
+
+from kivymd.app import MDApp
+
+from api_service import APIService
+from audio_cache import AudioCache, CacheStore
+from detail_cache import CachedAPIService, DetailCache
+from offline_dict import OfflineDictionary
+
+# Optional dictionary pack shipped with the app, built with offline_dict.py
+PACK_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'dictionary.vdp')
+
+_api = None
+
+
+def get_api():
+    """سرویس مشترک API با کش جزئیات کلمات"""
+    global _api
+    if _api is None:
+        audio_dir = os.path.join(MDApp.get_running_app().user_data_dir, 'audio')
+        store = CacheStore()
+        _api = CachedAPIService(APIService.from_environment(), DetailCache(store=store),
+                                AudioCache(audio_dir, store=store),
+                                pack=OfflineDictionary.open(PACK_PATH))
+    return _api
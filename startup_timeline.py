@@ -0,0 +1,24 @@
+"""Startup timeline: how long each phase from launch to first frame took.
+
+Import this before anything from Kivy so the import phase is measured too.
+"""
+import time
+
+_started = time.perf_counter()
+_last = _started
+phases = []
+
+
+def mark(phase):
+    """Close the current phase under the given name"""
+    global _last
+    now = time.perf_counter()
+    phases.append((phase, now - _last))
+    _last = now
+
+
+def report():
+    from kivy.logger import Logger
+    for phase, seconds in phases:
+        Logger.info(f'Startup: {phase:<24} {seconds * 1000:7.1f} ms')
+    Logger.info(f'Startup: {"total":<24} {(_last - _started) * 1000:7.1f} ms')
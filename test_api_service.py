@@ -0,0 +1,82 @@
+"""APIService against the local stand-in server.
+
+    python -m unittest test_api_service
+"""
+import unittest
+
+from api_service import APIService
+from dev_server import ENTRIES_PATH, BATCH_PATH, start_server
+
+
+class APIServiceTest(unittest.TestCase):
+    def start(self, **options):
+        server, url = start_server(port=0, **options)
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        return server, url
+
+    def service(self, url, batch=True, **options):
+        options.setdefault('backoff', 0)
+        api = APIService(url + ENTRIES_PATH, url + BATCH_PATH if batch else None, **options)
+        self.addCleanup(api.close)
+        return api
+
+    def test_batch_uses_one_request_per_chunk(self):
+        server, url = self.start()
+        api = self.service(url, max_batch=100)
+        words = [f'word{chr(97 + i % 26)}{chr(97 + i // 26)}' for i in range(250)] + ['Hello', 'x1']
+
+        results = api.get_word_details_batch(words)
+
+        self.assertEqual(server.stats['POST'], 3)
+        self.assertEqual(server.stats['GET'], 0)
+        self.assertEqual(len(results), 252)
+        self.assertEqual(results['hello']['phonetic'], 'həˈləʊ')
+        self.assertIsNone(results['x1'])
+
+    def test_connections_are_kept_alive(self):
+        server, url = self.start()
+        api = self.service(url, max_connections=1)
+
+        for word in ('hello', 'world', 'book') * 5:
+            self.assertIsNotNone(api.get_word_details(word))
+
+        self.assertEqual(server.stats['GET'], 15)
+        self.assertEqual(server.stats['connections'], 1)
+
+    def test_batch_without_endpoint_shares_the_pool(self):
+        server, url = self.start()
+        api = self.service(url, batch=False, max_connections=2)
+
+        results = api.get_word_details_batch(['hello', 'world', 'book', 'learn'] * 3)
+
+        self.assertEqual(len(results), 4)
+        self.assertEqual(server.stats['GET'], 4)
+        self.assertLessEqual(server.stats['connections'], 2)
+
+    def test_503_is_retried(self):
+        server, url = self.start(fail_rate=0.5)
+        api = self.service(url, retries=30)
+
+        for word in ('hello', 'world', 'book', 'learn', 'study', 'water', 'friend', 'happy'):
+            self.assertIsNotNone(api.get_word_details(word))
+
+        self.assertEqual(server.stats['GET'], 8 + server.stats['failed'])
+
+    def test_gives_up_after_the_last_retry(self):
+        server, url = self.start(fail_rate=1.0)
+        api = self.service(url, retries=2)
+
+        self.assertIsNone(api.get_word_details('hello'))
+        self.assertEqual(server.stats['GET'], 3)
+
+    def test_404_is_not_retried(self):
+        server, url = self.start()
+        api = self.service(url, retries=2)
+
+        self.assertIsNone(api.get_word_details('not-a-word'))
+        self.assertEqual(server.stats['GET'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
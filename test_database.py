@@ -0,0 +1,198 @@
+"""Database behaviour on a temporary file.
+
+    python -m unittest test_database
+"""
+import os
+import sqlite3
+import tempfile
+import threading
+import unittest
+from datetime import date, timedelta
+
+from database import Database, connect
+from review_writer import ReviewWriter
+from scheduler import SM2Scheduler
+
+
+def days_ago(days):
+    return (date.today() - timedelta(days=days)).isoformat()
+
+
+class DatabaseTestCase(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'test.db')
+        self.db = Database(self.path, seed=1, initial_words=False)
+        self.addCleanup(self.db.close)
+
+    def add_words(self, count):
+        self.db.add_words_bulk((f'word{i}', f'meaning{i}') for i in range(count))
+        return [row[0] for row in self.db.conn.execute('SELECT id FROM words ORDER BY id')]
+
+    def answer_on(self, word_id, is_correct, day):
+        """Record an answer as if it was given on day (ISO date)"""
+        with self.db.conn:
+            self.db.apply_review(self.db.cursor, word_id, is_correct, day, 1500)
+
+    def count(self, table):
+        return self.db.conn.execute(f'SELECT count(*) FROM {table}').fetchone()[0]
+
+
+class ReviewLogTest(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.first, self.second = self.add_words(2)
+        for days in (400, 200, 100, 10, 1):
+            self.answer_on(self.first, True, days_ago(days))
+        self.answer_on(self.second, False, days_ago(120))
+        self.answer_on(self.second, True, days_ago(5))
+
+    def test_history_is_newest_first(self):
+        history = self.db.get_review_history(self.first)
+        self.assertEqual(len(history), 5)
+        self.assertEqual([grade for day, grade, response_ms in history], [1] * 5)
+        self.assertEqual([day for day, grade, response_ms in history],
+                         sorted((day for day, grade, response_ms in history), reverse=True))
+        self.assertEqual(len(self.db.get_review_history(self.first, limit=2)), 2)
+
+    def test_compact_folds_old_answers_into_summaries(self):
+        self.assertEqual(self.db.compact_reviews(keep_days=90, chunk_size=2), 4)
+
+        self.assertEqual(self.count('reviews'), 3)
+        summary = dict((row[0], row[1:]) for row in self.db.conn.execute(
+            'SELECT word_id, reviews, correct FROM review_summary'))
+        self.assertEqual(summary, {self.first: (3, 3), self.second: (1, 0)})
+        # Nothing left to fold
+        self.assertEqual(self.db.compact_reviews(keep_days=90), 0)
+
+    def test_compact_adds_to_existing_summaries(self):
+        self.db.compact_reviews(keep_days=150)
+        self.db.compact_reviews(keep_days=90)
+        reviews, correct = self.db.conn.execute(
+            'SELECT reviews, correct FROM review_summary WHERE word_id = ?', (self.first,)).fetchone()
+        self.assertEqual((reviews, correct), (3, 3))
+
+    def test_prune_drops_old_answers(self):
+        self.assertEqual(self.db.prune_reviews(keep_days=150, chunk_size=1), 2)
+        self.assertEqual(self.count('reviews'), 5)
+        self.assertEqual(self.count('review_summary'), 0)
+
+    def test_compact_in_background_runs_on_the_writer(self):
+        self.db.start_writer(flush_interval=0.05)
+        self.db.compact_in_background(keep_days=90)
+        # Tasks and flushes are handled in order by the writer thread
+        self.assertTrue(self.db.flush(timeout=5))
+        self.assertEqual(self.count('reviews'), 3)
+        self.assertEqual(self.count('review_summary'), 2)
+
+
+class WordListTest(DatabaseTestCase):
+    def test_pages_continue_newest_first(self):
+        ids = self.add_words(23)
+        self.db.add_word('newest', 'تازه')
+        listed = [word.id for word in self.db.iter_words(limit=5)]
+        self.assertEqual(listed, sorted(ids + [max(ids) + 1], reverse=True))
+        self.assertEqual([word.id for word in self.db.iter_words(after=ids[3], limit=5)],
+                         ids[2::-1])
+        self.assertEqual(listed, [word.id for word in self.db.get_all_words()])
+
+
+class StatisticsTest(DatabaseTestCase):
+    def test_counters_follow_answers_and_new_words(self):
+        ids = self.add_words(6)
+        for word_id in ids[:3]:
+            self.db.update_word_status(word_id, True)
+        self.db.update_word_status(ids[3], False)
+        self.db.update_word_status(ids[3], False)
+        self.db.add_word('extra', 'اضافه')
+
+        stats = self.db.get_statistics()
+        self.assertEqual((stats['learned'], stats['learning']), (0, 7))
+        self.assertEqual((stats['correct_total'], stats['wrong_total']), (3, 2))
+        self.assertEqual(stats['accuracy'], 60)
+        # Answered words are due later, a missed one tomorrow; two old and the new one are due now
+        self.assertEqual(stats['due_today'], 3)
+        self.assertEqual(self.db.check_integrity(), [])
+
+    def test_learned_words_leave_the_due_counts(self):
+        word_id, = self.add_words(1)
+        for days in range(self.db.scheduler.learned_after, 0, -1):
+            self.answer_on(word_id, True, days_ago(days * 100))
+
+        stats = self.db.get_statistics()
+        self.assertEqual((stats['learned'], stats['learning'], stats['due_today']), (1, 0, 0))
+        self.assertEqual(self.db.check_integrity(), [])
+
+    def test_reschedule_keeps_the_counters(self):
+        ids = self.add_words(40)
+        for i, word_id in enumerate(ids[:30]):
+            for days in range(i % 4 + 1, 0, -1):
+                self.answer_on(word_id, i % 5 != 0, days_ago(days * 3))
+        before = self.db.get_statistics()
+
+        self.db.reschedule(SM2Scheduler(first_interval=20, second_interval=40))
+        self.assertEqual(self.db.check_integrity(), [])
+        after = self.db.get_statistics()
+        self.assertEqual(after['learned'] + after['learning'], 40)
+        self.assertEqual((after['correct_total'], after['wrong_total']),
+                         (before['correct_total'], before['wrong_total']))
+
+
+class ReviewWriterTest(DatabaseTestCase):
+    def test_flush_waits_for_queued_answers(self):
+        ids = self.add_words(3)
+        # Long interval: only the flush request makes the writer commit
+        self.db.start_writer(flush_interval=60)
+        for word_id in ids:
+            self.db.update_word_status(word_id, True, 1200)
+        self.assertTrue(self.db.flush(timeout=5))
+        self.assertEqual(self.count('reviews'), 3)
+        self.assertEqual(self.db.get_statistics()['correct_total'], 3)
+
+    def test_flush_without_waiting_calls_back_after_the_commit(self):
+        word_id, = self.add_words(1)
+        self.db.start_writer(flush_interval=60)
+        self.db.update_word_status(word_id, True)
+        committed = []
+        saved = threading.Event()
+
+        def on_done():
+            # Runs on the writer thread, which cannot use self.db.conn
+            conn = sqlite3.connect(self.path)
+            committed.append(conn.execute('SELECT count(*) FROM reviews').fetchone()[0])
+            conn.close()
+            saved.set()
+
+        self.assertFalse(self.db.flush(wait=False, on_done=on_done))
+        self.assertTrue(saved.wait(5))
+        self.assertEqual(committed, [1])
+
+    def test_failed_write_is_retried_before_the_flush_returns(self):
+        word_id, = self.add_words(1)
+        locked = threading.Event()
+        locked.set()
+        attempts = []
+
+        def apply_review(cursor, *args):
+            attempts.append(args)
+            if locked.is_set():
+                raise sqlite3.OperationalError('database is locked')
+            self.db.apply_review(cursor, *args)
+
+        writer = ReviewWriter(lambda: connect(self.path), apply_review, flush_interval=0.02)
+        self.addCleanup(writer.close)
+        writer.submit(word_id, False, date.today().isoformat())
+
+        self.assertFalse(writer.flush(timeout=0.2))
+        self.assertGreater(len(attempts), 1)
+        self.assertEqual(self.count('reviews'), 0)
+
+        locked.clear()
+        self.assertTrue(writer.flush(timeout=5))
+        self.assertEqual(self.count('reviews'), 1)
+        self.assertEqual(self.db.check_integrity(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+"""DetailCache and AudioCache in their own cache file.
+
+    python -m unittest test_detail_cache
+"""
+import os
+import sqlite3
+import tempfile
+import threading
+import unittest
+
+from audio_cache import AudioCache, CacheStore
+from database import Database, cache_path_for
+from detail_cache import DetailCache
+
+
+class CacheFileTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        self.path = os.path.join(directory.name, 'test.db')
+        self.store = CacheStore(cache_path_for(self.path))
+        self.addCleanup(self.store.conn.close)
+
+    def tables(self, path):
+        conn = sqlite3.connect(path)
+        try:
+            return {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        finally:
+            conn.close()
+
+    def test_caches_stay_out_of_the_word_database(self):
+        db = Database(self.path, initial_words=False)
+        self.addCleanup(db.close)
+        details = DetailCache(store=self.store)
+        audio = AudioCache(os.path.join(self.directory, 'audio'), store=self.store)
+        details.put('Hello', {'phonetic': 'həˈləʊ'})
+        audio.put('hello', b'ID3 audio')
+
+        self.assertEqual(details.get('hello'), {'phonetic': 'həˈləʊ'})
+        self.assertIsNotNone(audio.get('Hello'))
+        self.assertTrue({'detail_cache', 'audio_cache'} <= self.tables(cache_path_for(self.path)))
+        self.assertFalse({'detail_cache', 'audio_cache'} & self.tables(self.path))
+
+    def test_writes_from_several_threads_share_one_connection(self):
+        details = DetailCache(store=self.store, max_entries=50)
+        audio = AudioCache(os.path.join(self.directory, 'audio'), store=self.store, max_bytes=200)
+        errors = []
+
+        def write(start):
+            try:
+                for i in range(start, start + 40):
+                    details.put_many([(f'word{i}', {'examples': [str(i)]})])
+                    audio.put(f'word{i}', f'audio {i}'.encode())
+                    details.get(f'word{i - 1}')
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=write, args=(start,)) for start in (0, 100, 200)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(self.store.conn.execute('SELECT count(*) FROM detail_cache').fetchone()[0], 50)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,42 @@
+"""Dictionary packs built from JSON Lines.
+
+    python -m unittest test_offline_dict
+"""
+import json
+import os
+import tempfile
+import unittest
+
+from offline_dict import OfflineDictionary, build, read_source
+
+
+class OfflineDictionaryTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+
+    def build_pack(self, items):
+        source = os.path.join(self.directory, 'words.jsonl')
+        with open(source, 'w', encoding='utf-8') as f:
+            for item in items:
+                f.write(json.dumps(item, ensure_ascii=False) + '\n')
+        path = os.path.join(self.directory, 'dictionary.vdp')
+        build(path, read_source(source))
+        pack = OfflineDictionary.open(path)
+        self.addCleanup(pack.close)
+        return pack
+
+    def test_phonetic_slashes_are_dropped_as_online(self):
+        pack = self.build_pack([
+            {'word': 'Hello', 'phonetic': '/həˈləʊ/', 'examples': ['Hello there.']},
+            {'word': 'world', 'phonetic': 'wɜːld'},
+        ])
+        self.assertEqual(pack.get('hello'),
+                         {'phonetic': 'həˈləʊ', 'examples': ['Hello there.'], 'audio': None})
+        self.assertEqual(pack.get('World')['phonetic'], 'wɜːld')
+        self.assertIsNone(pack.get('book'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+"""PracticeSession against a temporary database.
+
+    python -m unittest test_practice_session
+"""
+import os
+import tempfile
+import unittest
+
+from database import Database
+from practice_session import PracticeSession
+
+
+class PracticeSessionTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.db = Database(os.path.join(directory.name, 'test.db'), seed=1, initial_words=False)
+        self.addCleanup(self.db.close)
+
+    def add_words(self, count):
+        self.db.add_words_bulk((f'word{i}', f'meaning{i}') for i in range(count))
+
+    def drain(self, session):
+        """Ids of every card until the session ends, without answering"""
+        ids = []
+        while session.next_word() is not None:
+            ids.append(session.current.id)
+        return ids
+
+    def test_refills_never_repeat_a_word(self):
+        # Unanswered words stay due, so only `exclude` keeps later batches apart
+        self.add_words(23)
+        session = PracticeSession(self.db, batch_size=5, refill_below=2)
+        ids = self.drain(session)
+        self.assertEqual(len(ids), 23)
+        self.assertEqual(len(set(ids)), 23)
+        self.assertTrue(session.exhausted)
+
+    def test_limit_caps_the_session(self):
+        self.add_words(50)
+        session = PracticeSession(self.db, batch_size=5, limit=12)
+        self.assertEqual(len(self.drain(session)), 12)
+
+    def test_exhausted_once_the_limit_is_taken(self):
+        self.add_words(50)
+        session = PracticeSession(self.db, batch_size=10, limit=10)
+        session.next_word()
+        self.assertTrue(session.exhausted)
+        self.assertEqual(session.total, 10)
+
+    def test_requeue_gap_and_max_requeues(self):
+        self.add_words(20)
+        session = PracticeSession(self.db, batch_size=10, requeue_gap=4, max_requeues=2)
+        missed = session.next_word().id
+        cards = []
+        while session.current is not None:
+            cards.append(session.current.id)
+            session.answer(session.current.id != missed)
+            session.next_word()
+
+        positions = [i for i, word_id in enumerate(cards) if word_id == missed]
+        # Shown once, then requeued twice, each time four cards later
+        self.assertEqual(positions, [0, 5, 10])
+        self.assertEqual(len(cards), 20 + 2)
+        self.assertEqual(session.answered, 22)
+        self.assertEqual(session.correct, 19)
+
+    def test_position_and_total(self):
+        self.add_words(30)
+        session = PracticeSession(self.db, batch_size=10, limit=10)
+        session.next_word()
+        self.assertEqual((session.position, session.total), (1, 10))
+
+        session.answer(True)
+        session.next_word()
+        self.assertEqual((session.position, session.total), (2, 10))
+
+        # A missed word is queued again: one more card in the session
+        session.answer(False)
+        self.assertEqual(session.total, 11)
+        session.next_word()
+        self.assertEqual(session.position, 3)
+
+    def test_upcoming_does_not_take_words(self):
+        self.add_words(10)
+        session = PracticeSession(self.db, batch_size=10)
+        session.next_word()
+        upcoming = session.upcoming(3)
+        self.assertEqual(len(upcoming), 3)
+        self.assertEqual(session.next_word().id, upcoming[0].id)
+
+    def test_answer_without_a_current_word_is_ignored(self):
+        self.add_words(3)
+        session = PracticeSession(self.db)
+        session.next_word()
+        session.answer(True)
+        session.answer(True)
+        self.assertEqual(session.answered, 1)
+
+    def test_empty_deck(self):
+        session = PracticeSession(self.db)
+        self.assertIsNone(session.next_word())
+        self.assertEqual(session.total, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+"""SM2Scheduler intervals and their use by the database.
+
+    python -m unittest test_scheduler
+"""
+import os
+import tempfile
+import unittest
+from datetime import date, timedelta
+
+from database import Database
+from scheduler import SM2Scheduler
+
+
+def schedule(scheduler, ease, answers):
+    """Intervals after each answer, starting from a new word with this ease"""
+    streak = 0
+    intervals = []
+    for is_correct in answers:
+        streak, ease, interval, learned = scheduler.review(streak, ease, is_correct)
+        intervals.append(interval)
+    return intervals
+
+
+class SchedulerTest(unittest.TestCase):
+    def setUp(self):
+        self.scheduler = SM2Scheduler()
+
+    def test_initial_ease_keeps_the_base_intervals(self):
+        self.assertEqual(schedule(self.scheduler, 2.45, [True, True]), [3, 6])
+
+    def test_ease_changes_the_schedule_from_the_first_correct_answer(self):
+        hard = schedule(self.scheduler, 1.5, [True, True])
+        easy = schedule(self.scheduler, 3.0, [True, True])
+        self.assertNotEqual(hard, easy)
+        self.assertLess(hard[0], easy[0])
+        self.assertLess(hard[1], easy[1])
+
+    def test_batch_matches_single_answers(self):
+        streaks = [0, 1, 1, 2, 2, 3, 6]
+        eases = [2.5, 1.3, 3.0, 1.8, 2.7, 2.5, 3.5]
+        last_reviews = ['2026-03-01'] * len(streaks)
+        next_reviews, learned = self.scheduler.reschedule_batch(streaks, eases, last_reviews)
+        for streak, ease, next_review, is_learned in zip(streaks, eases, next_reviews, learned):
+            expected = date(2026, 3, 1) + timedelta(days=self.scheduler.interval(streak, ease))
+            self.assertEqual(next_review, expected.isoformat())
+            self.assertEqual(is_learned, streak >= self.scheduler.learned_after)
+        self.assertEqual(self.scheduler._reschedule_loop(streaks, eases, last_reviews),
+                         (next_reviews, learned))
+
+
+class DatabaseScheduleTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.db = Database(os.path.join(directory.name, 'test.db'), seed=1)
+        self.addCleanup(self.db.close)
+
+    def test_words_with_different_ease_get_different_review_dates(self):
+        hard, easy = self.db.get_daily_words(2)
+        with self.db.conn:
+            self.db.conn.execute('UPDATE words SET ease = 1.4 WHERE id = ?', (hard.id,))
+            self.db.conn.execute('UPDATE words SET ease = 3.0 WHERE id = ?', (easy.id,))
+        self.db.update_word_status(hard.id, True)
+        self.db.update_word_status(easy.id, True)
+
+        dates = dict(self.db.conn.execute(
+            'SELECT id, next_review FROM words WHERE id IN (?, ?)', (hard.id, easy.id)))
+        self.assertLess(dates[hard.id], dates[easy.id])
+
+    def test_reschedule_applies_new_parameters(self):
+        word = self.db.get_daily_words(1)[0]
+        self.db.update_word_status(word.id, True)
+        self.assertEqual(self.db.reschedule(SM2Scheduler(first_interval=10)), 1)
+
+        last_review, next_review = self.db.conn.execute(
+            'SELECT last_review, next_review FROM words WHERE id = ?', (word.id,)).fetchone()
+        self.assertEqual(date.fromisoformat(next_review) - date.fromisoformat(last_review),
+                         timedelta(days=10))
+        self.assertEqual(self.db.check_integrity(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+"""vocab_cli commands on a temporary database.
+
+    python -m unittest test_vocab_cli
+"""
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+from datetime import date, timedelta
+
+import vocab_cli
+from database import Database
+
+
+class VocabCLITest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        self.path = os.path.join(directory.name, 'test.db')
+
+    def run_cli(self, *args):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output), contextlib.redirect_stderr(io.StringIO()):
+            status = vocab_cli.main(['--db', self.path, *args])
+        return status, output.getvalue()
+
+    def write_csv(self, name, count):
+        path = os.path.join(self.directory, name)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write('english,persian\n')
+            for i in range(count):
+                f.write(f'word{i},meaning{i}\n')
+        return path
+
+    def word_count(self):
+        db = Database(self.path, initial_words=False)
+        try:
+            return db.conn.execute('SELECT count(*) FROM words').fetchone()[0]
+        finally:
+            db.close()
+
+    def test_import_into_a_new_file_adds_only_the_imported_words(self):
+        self.run_cli('import', '--quiet', self.write_csv('words.csv', 23))
+        self.assertEqual(self.word_count(), 23)
+
+        backup = os.path.join(self.directory, 'backup.jsonl')
+        self.run_cli('export', backup)
+        self.path = os.path.join(self.directory, 'restored.db')
+        self.run_cli('import', '--quiet', backup)
+        self.assertEqual(self.word_count(), 23)
+
+    def test_compact_prune_and_history(self):
+        self.run_cli('import', '--quiet', self.write_csv('words.csv', 1))
+        db = Database(self.path, initial_words=False)
+        for days in (400, 200, 30):
+            day = (date.today() - timedelta(days=days)).isoformat()
+            with db.conn:
+                db.apply_review(db.cursor, 1, True, day)
+        db.close()
+
+        status, output = self.run_cli('history', 'WORD0')
+        self.assertEqual(status, 0)
+        self.assertEqual(output.count('known'), 3)
+
+        status, output = self.run_cli('prune', '--keep-days', '365')
+        self.assertIn('Removed 1 answers', output)
+        status, output = self.run_cli('compact', '--keep-days', '90')
+        self.assertIn('Folded 1 answers', output)
+        status, output = self.run_cli('history', 'word0')
+        self.assertEqual(output.count('known'), 1)
+
+        status, output = self.run_cli('history', 'missing')
+        self.assertEqual(status, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
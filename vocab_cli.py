@@ -0,0 +1,199 @@
+"""Command-line deck maintenance without the UI.
+
+    python vocab_cli.py import words.csv
+    python vocab_cli.py export backup.jsonl
+    python vocab_cli.py stats --json
+    python vocab_cli.py reschedule --max-interval 365
+    python vocab_cli.py analyze --vacuum
+    python vocab_cli.py check
+    python vocab_cli.py compact --keep-days 90
+    python vocab_cli.py prune --keep-days 365
+    python vocab_cli.py history hello
+    python vocab_cli.py enrich --limit 2000
+
+Works on vocabulary.db in the current directory unless --db is given.
+Never imports Kivy, so it starts in a few tens of milliseconds.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import date
+
+from database import DB_PATH, EPOCH_ORDINAL, Database, cache_path_for
+from importer import import_file, write_words
+from scheduler import SM2Scheduler
+
+
+def cmd_import(db, args):
+    started = time.perf_counter()
+    total = 0
+    for path in args.files:
+        progress = None if args.quiet else (
+            lambda count, path=path: print(f'\r{path}: {count} words', end='', file=sys.stderr))
+        added = import_file(db, path, args.chunk_size, progress)
+        if not args.quiet:
+            print(file=sys.stderr)
+        total += added
+    print(f'Imported {total} words in {time.perf_counter() - started:.1f} s')
+
+
+def cmd_export(db, args):
+    count = write_words(args.file, db.iter_pairs())
+    print(f'Exported {count} words to {args.file}')
+
+
+def cmd_stats(db, args):
+    stats = db.get_statistics()
+    stats['words'] = stats['learned'] + stats['learning']
+    stats['file_bytes'] = os.path.getsize(db.path)
+    if args.json:
+        print(json.dumps(stats))
+        return
+    for name, value in stats.items():
+        print(f'{name:<14} {value}')
+
+
+def cmd_reschedule(db, args):
+    options = {name: value for name, value in (
+        ('first_interval', args.first_interval),
+        ('second_interval', args.second_interval),
+        ('learned_after', args.learned_after),
+        ('max_interval', args.max_interval),
+    ) if value is not None}
+    started = time.perf_counter()
+    count = db.reschedule(SM2Scheduler(**options))
+    print(f'Rescheduled {count} words in {time.perf_counter() - started:.1f} s')
+
+
+def cmd_analyze(db, args):
+    before = os.path.getsize(db.path)
+    db.analyze(vacuum=args.vacuum)
+    if args.vacuum:
+        print(f'Analyzed and vacuumed: {before} -> {os.path.getsize(db.path)} bytes')
+    else:
+        print('Analyzed')
+
+
+def cmd_check(db, args):
+    problems = db.check_integrity()
+    for problem in problems:
+        print(problem)
+    if problems:
+        return 1
+    print('ok')
+    return 0
+
+
+def cmd_compact(db, args):
+    count = db.compact_reviews(args.keep_days)
+    print(f'Folded {count} answers older than {args.keep_days} days into per-word summaries')
+
+
+def cmd_prune(db, args):
+    count = db.prune_reviews(args.keep_days)
+    print(f'Removed {count} answers older than {args.keep_days} days')
+
+
+def cmd_history(db, args):
+    words = [word for word in db.search_words(args.word)
+             if word.english.casefold() == args.word.casefold()]
+    if not words:
+        print(f'No word {args.word!r}', file=sys.stderr)
+        return 1
+    for word in words:
+        print(f'{word.english} ({word.persian})')
+        for day, grade, response_ms in db.get_review_history(word.id, args.limit):
+            when = date.fromordinal(EPOCH_ORDINAL + day).isoformat()
+            timing = f'  {response_ms} ms' if response_ms is not None else ''
+            print(f'  {when}  {"known" if grade else "missed"}{timing}')
+    return 0
+
+
+def cmd_enrich(db, args):
+    """Fill the details cache for the words due next, in batches"""
+    # Imported here: the HTTP stack costs more than the rest of the startup
+    from api_service import APIService
+    from detail_cache import CachedAPIService, DetailCache
+
+    api = APIService.from_environment()
+    service = CachedAPIService(api, DetailCache(cache_path_for(db.path)))
+    words = [word.english for word in db.get_daily_words(args.limit)]
+    started = time.perf_counter()
+    found = 0
+    for start in range(0, len(words), args.batch_size):
+        results = service.get_word_details_batch(words[start:start + args.batch_size])
+        found += sum(1 for data in results.values() if data)
+    api.close()
+    print(f'Details for {found} of {len(words)} words in {time.perf_counter() - started:.1f} s')
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description='Vocabulary deck maintenance')
+    parser.add_argument('--db', default=DB_PATH, help=f'database file (default {DB_PATH})')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    command = commands.add_parser('import', help='add words from CSV/TSV/JSON/JSON Lines files')
+    command.add_argument('files', nargs='+')
+    command.add_argument('--chunk-size', type=int, default=5000)
+    command.add_argument('--quiet', action='store_true')
+    command.set_defaults(run=cmd_import)
+
+    command = commands.add_parser('export', help='write all words to a file, format by extension')
+    command.add_argument('file')
+    command.set_defaults(run=cmd_export)
+
+    command = commands.add_parser('stats', help='learned/learning/due counts and accuracy')
+    command.add_argument('--json', action='store_true')
+    command.set_defaults(run=cmd_stats)
+
+    command = commands.add_parser('reschedule', help='recompute review dates for every reviewed word')
+    command.add_argument('--first-interval', type=int)
+    command.add_argument('--second-interval', type=int)
+    command.add_argument('--learned-after', type=int)
+    command.add_argument('--max-interval', type=int)
+    command.set_defaults(run=cmd_reschedule)
+
+    command = commands.add_parser('analyze', help='refresh query planner statistics')
+    command.add_argument('--vacuum', action='store_true', help='also rewrite the file compactly')
+    command.set_defaults(run=cmd_analyze)
+
+    command = commands.add_parser('check', help='integrity check; exit status 1 on problems')
+    command.set_defaults(run=cmd_check)
+
+    command = commands.add_parser('compact', help='fold old answers into per-word summaries')
+    command.add_argument('--keep-days', type=int, default=90)
+    command.set_defaults(run=cmd_compact)
+
+    command = commands.add_parser('prune', help='delete old answers without summarizing them')
+    command.add_argument('--keep-days', type=int, default=365)
+    command.set_defaults(run=cmd_prune)
+
+    command = commands.add_parser('history', help='latest answers for one word')
+    command.add_argument('word')
+    command.add_argument('--limit', type=int, default=50)
+    command.set_defaults(run=cmd_history)
+
+    command = commands.add_parser('enrich', help='cache word details for the words due next; '
+                                                 'VOCAB_API_URL/VOCAB_API_BATCH_URL pick the server')
+    command.add_argument('--limit', type=int, default=5000, help='words to cover (the cache holds 5000)')
+    command.add_argument('--batch-size', type=int, default=100)
+    command.set_defaults(run=cmd_enrich)
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command != 'import' and not os.path.exists(args.db):
+        parser.error(f'no database at {args.db}')
+    db = Database(args.db, initial_words=False)
+    try:
+        return args.run(db, args) or 0
+    finally:
+        db.close()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
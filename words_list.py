@@ -0,0 +1,263 @@
+import re
+from itertools import islice
+
+from kivymd.uix.screen import MDScreen
+from kivymd.uix.button import MDIconButton
+from kivymd.uix.card import MDCard
+from kivymd.uix.label import MDLabel
+from kivymd.uix.boxlayout import MDBoxLayout
+from kivymd.uix.textfield import MDTextField
+from kivymd.uix.list import ThreeLineAvatarIconListItem, IconLeftWidget, IconRightWidget
+from kivy.uix.recycleview import RecycleView
+from kivy.uix.recycleboxlayout import RecycleBoxLayout
+from kivy.metrics import dp
+from kivy.properties import StringProperty, NumericProperty, BooleanProperty, ObjectProperty
+from kivy.clock import Clock
+from database import get_database, normalize_text
+from services import get_api
+from audio_cache import play_file
+from workers import run_in_background
+
+
+class WordListItem(ThreeLineAvatarIconListItem):
+    """ردیف لیست کلمات؛ RecycleView فقط ردیف‌های قابل مشاهده رو می‌سازه و بازیافت می‌کنه"""
+    english = StringProperty()
+    word_id = NumericProperty(0)
+    learned = BooleanProperty(False)
+    screen = ObjectProperty(None, allownone=True)
+    
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.status_icon = IconLeftWidget(
+            icon="book-open-variant",
+            theme_icon_color="Custom",
+            icon_color=(0.9, 0.6, 0.2, 1)
+        )
+        self.add_widget(self.status_icon)
+        
+        # Add speaker button
+        self.add_widget(IconRightWidget(
+            icon="volume-high",
+            on_release=lambda x: self.play()
+        ))
+    
+    def on_learned(self, instance, learned):
+        self.status_icon.icon = "check-circle" if learned else "book-open-variant"
+        self.status_icon.icon_color = (0.2, 0.8, 0.2, 1) if learned else (0.9, 0.6, 0.2, 1)
+    
+    def on_release(self):
+        self.play()
+    
+    def play(self):
+        if self.screen:
+            self.screen.play_word_audio(self.english)
+
+
+class WordsListScreen(MDScreen):
+    PAGE_SIZE = 50
+    SEARCH_LIMIT = 100
+    SEARCH_DELAY = 0.25
+    
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.db = get_database()
+        self.api = get_api()
+        self.word_source = None
+        # Distance scrolled from the top when a page was appended; restored
+        # once the rows layout has grown, and None when no page is loading
+        self.page_anchor = None
+        
+        # Search state: typing only re-arms the trigger, the query runs once
+        # input pauses for SEARCH_DELAY
+        self.search_trigger = Clock.create_trigger(self.run_search, self.SEARCH_DELAY)
+        self.pending_query = ''
+        self.last_terms = None
+        self.last_results = []
+        self.search_rows = {}
+        self.build_ui()
+    
+    def build_ui(self):
+        layout = MDBoxLayout(orientation='vertical')
+        
+        # Header
+        header = MDCard(
+            size_hint_y=None,
+            height=dp(70),
+            elevation=5,
+            md_bg_color=(0.1, 0.5, 0.8, 1),
+            radius=[0, 0, 0, 0]
+        )
+        
+        header_layout = MDBoxLayout(padding=dp(10), spacing=dp(10))
+        
+        back_btn = MDIconButton(
+            icon="arrow-left",
+            theme_icon_color="Custom",
+            icon_color=(1, 1, 1, 1),
+            on_release=lambda x: self.go_back()
+        )
+        
+        title = MDLabel(
+            text="My Word List",
+            font_style="H5",
+            halign="left",
+            theme_text_color="Custom",
+            text_color=(1, 1, 1, 1)
+        )
+        
+        header_layout.add_widget(back_btn)
+        header_layout.add_widget(title)
+        
+        header.add_widget(header_layout)
+        
+        # Search box
+        search_card = MDCard(
+            size_hint_y=None,
+            height=dp(70),
+            padding=dp(10),
+            elevation=2
+        )
+        
+        self.search_field = MDTextField(
+            hint_text="🔍 Search words...",
+            mode="rectangle",
+            on_text=self.search_words
+        )
+        
+        search_card.add_widget(self.search_field)
+        
+        # Words list: virtualized, only the visible rows exist as widgets
+        self.words_list = RecycleView()
+        self.words_list.viewclass = WordListItem
+        rows_layout = RecycleBoxLayout(
+            orientation='vertical',
+            spacing=dp(5),
+            default_size=(None, dp(88)),
+            default_size_hint=(1, None),
+            size_hint_y=None
+        )
+        rows_layout.bind(minimum_height=rows_layout.setter('height'))
+        rows_layout.bind(height=self.restore_page_anchor)
+        self.words_list.add_widget(rows_layout)
+        self.words_list.bind(scroll_y=self.on_scroll)
+        
+        layout.add_widget(header)
+        layout.add_widget(search_card)
+        layout.add_widget(self.words_list)
+        
+        self.add_widget(layout)
+    
+    def load_words(self):
+        self.words_list.data = []
+        self.words_list.scroll_y = 1
+        # Keyset-paginated source; rows are only fetched when a page is shown
+        self.word_source = self.db.iter_words(limit=self.PAGE_SIZE)
+        self.load_more_words()
+        # The first page starts at the top; a list of the old height would never clear the anchor
+        self.page_anchor = None
+    
+    def load_more_words(self):
+        """صفحه بعدی کلمات"""
+        page = list(islice(self.word_source, self.PAGE_SIZE))
+        if len(page) < self.PAGE_SIZE:
+            self.word_source = None
+        if not page:
+            return
+        # scroll_y is relative to the content height: remember the absolute
+        # offset so the longer list does not jump past the new rows
+        self.page_anchor = (1 - self.words_list.scroll_y) * self.scrollable_height()
+        self.words_list.data.extend(self.row_data(word) for word in page)
+    
+    def scrollable_height(self):
+        return max(0, self.words_list.children[0].height - self.words_list.height)
+    
+    def restore_page_anchor(self, layout, height):
+        if self.page_anchor is None:
+            return
+        scrollable = self.scrollable_height()
+        anchor, self.page_anchor = self.page_anchor, None
+        self.words_list.scroll_y = 1 - min(anchor, scrollable) / scrollable if scrollable else 1
+    
+    def row_data(self, word):
+        return {
+            'text': f"[b]{word.english}[/b]",
+            'secondary_text': word.persian,
+            'tertiary_text': f"Reviewed: {word.last_review or 'Never'}",
+            'english': word.english,
+            'word_id': word.id,
+            'learned': bool(word.learned),
+            'screen': self
+        }
+    
+    def on_scroll(self, instance, scroll_y):
+        # Near the bottom: fetch the next page, one at a time
+        if self.word_source is not None and self.page_anchor is None and scroll_y <= 0.05:
+            self.load_more_words()
+    
+    def search_words(self, instance, text):
+        """جستجوی کلمات (با تأخیر، بعد از توقف تایپ)"""
+        self.pending_query = text
+        # Drop the pending run for the previous, now stale, text
+        self.search_trigger.cancel()
+        self.search_trigger()
+    
+    def run_search(self, dt):
+        terms = re.findall(r'\w+', normalize_text(self.pending_query))
+        if not terms:
+            self.last_terms = None
+            self.search_rows = {}
+            self.load_words()
+            return
+        if terms == self.last_terms:
+            return
+        
+        if self.narrows_last_search(terms):
+            # Longer query, complete previous results: filter them instead of querying
+            results = [word for word in self.last_results if self.word_matches(word, terms)]
+        else:
+            results = self.db.search_words(' '.join(terms), self.SEARCH_LIMIT)
+        
+        self.last_terms = terms
+        self.last_results = results
+        self.show_search_results(results)
+    
+    def narrows_last_search(self, terms):
+        if not self.last_terms or len(self.last_results) >= self.SEARCH_LIMIT:
+            return False
+        if len(terms) < len(self.last_terms):
+            return False
+        # Every earlier term is still there, at most extended at its end
+        last = len(self.last_terms) - 1
+        return (terms[:last] == self.last_terms[:last]
+                and terms[last].startswith(self.last_terms[last]))
+    
+    def word_matches(self, word, terms):
+        tokens = re.findall(r'\w+', normalize_text(f"{word.english} {word.persian}"))
+        return all(any(token.startswith(term) for token in tokens) for term in terms)
+    
+    def show_search_results(self, results):
+        self.word_source = None
+        self.page_anchor = None
+        old_ids = [row['word_id'] for row in self.words_list.data]
+        new_ids = [word.id for word in results]
+        if old_ids == new_ids:
+            return
+        
+        # Reuse the row dicts of words that stay visible; the RecycleView only
+        # rebinds the rows on screen
+        rows = {}
+        for word in results:
+            rows[word.id] = self.search_rows.get(word.id) or self.row_data(word)
+        self.search_rows = rows
+        self.words_list.data = [rows[word_id] for word_id in new_ids]
+        self.words_list.scroll_y = 1
+    
+    def play_word_audio(self, word):
+        """پخش صدای کلمه از لیست"""
+        # The first play of a word downloads it; keep that off the UI thread
+        run_in_background(self.api.fetch_audio, word,
+                          on_done=lambda path: path is not None and play_file(path))
+    
+    def go_back(self):
+        self.manager.transition.direction = 'right'
+        self.manager.current = 'home'
@@ -0,0 +1,50 @@
+"""Background work for the screens.
+
+Blocking calls (network, disk) run on a small bounded thread pool and their
+results are handed back on the Kivy main thread through Clock.
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+from kivy.clock import Clock
+from kivy.logger import Logger
+
+MAX_WORKERS = 3
+
+_pool = None
+
+
+def get_pool():
+    global _pool
+    if _pool is None:
+        _pool = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix='vocab-worker')
+    return _pool
+
+
+def run_in_background(fn, *args, on_done=None):
+    """Run fn(*args) on the pool.
+
+    on_done(result) is called on the main thread; result is None if fn raised.
+    """
+    future = get_pool().submit(fn, *args)
+    if on_done is not None:
+        future.add_done_callback(
+            lambda f: Clock.schedule_once(lambda dt: on_done(_result(f, fn)))
+        )
+    return future
+
+
+def _result(future, fn):
+    if future.cancelled():
+        return None
+    error = future.exception()
+    if error is not None:
+        Logger.warning(f'Workers: {getattr(fn, "__name__", fn)} failed: {error!r}')
+        return None
+    return future.result()
+
+
+def shutdown():
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None